@@ -1,8 +1,12 @@
-from dataclasses import dataclass
-from typing import Dict, List
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Any, Callable, Dict, FrozenSet, Mapping, Tuple
 import random
+import sys
 
-@dataclass
+import ahocorasick
+
+@dataclass(slots=True, frozen=True, eq=False, repr=False)
 class Keyword:
     """Represents a keyword used for conversation analysis.
     
@@ -10,108 +14,225 @@ class Keyword:
         term: The keyword or phrase to match
         description: Explanation of the keyword's relevance
         weight: Importance multiplier for scoring (default 1.0)
+        term_key: Casefolded, interned term used for lookups (derived)
     """
     term: str
     description: str
     weight: float = 1.0
+    term_key: str = field(init=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, "term", sys.intern(self.term))
+        object.__setattr__(self, "term_key", sys.intern(self.term.casefold()))
+        object.__setattr__(self, "description", sys.intern(self.description))
 
-@dataclass
+@dataclass(slots=True, frozen=True, eq=False, repr=False)
 class Topic:
     """Represents a conversation topic with associated keywords.
     
     Attributes:
         name: Display name of the topic
         description: Brief explanation of what the topic covers
-        keywords: List of relevant keywords for analysis
+        keywords: Relevant keywords for analysis (stored as a tuple)
         introduction: Opening message to start conversations about this topic
+        terms: Set of all keyword terms (derived)
     """
     name: str
     description: str
-    keywords: List[Keyword]
+    keywords: Tuple[Keyword, ...]
     introduction: str
+    terms: FrozenSet[str] = field(init=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, "name", sys.intern(self.name))
+        object.__setattr__(self, "keywords", tuple(self.keywords))
+        object.__setattr__(self, "terms", frozenset(kw.term for kw in self.keywords))
 
-TOPICS_CONFIG: Dict[str, Topic] = {
-    "weather": Topic(
-        name="Weather",
-        description="Understanding weather patterns and atmospheric conditions",
-        keywords=[
-            Keyword("temperature", "Driven by solar radiation, altitude, and latitude", 1.0),
-            Keyword("humidity", "Amount of moisture in the air affecting comfort and precipitation", 1.0),
-            Keyword("air pressure", "Influences wind and storm systems", 1.0),
-            Keyword("wind patterns", "Caused by pressure differences and Earth's rotation", 1.0),
-            Keyword("precipitation", "Rain, snow, sleet, or hail depending on atmospheric conditions", 1.0),
-        ],
-        introduction="Hey! I've heard that you have some interesting insights about weather patterns. Could you tell me more? What do you think has the biggest influence on weather?"
-    ),
+# Keyword descriptions shared by several terms, defined once so every keyword
+# using them references the same string object.
+_DESC_NETWORK = "Especially for distributed or cloud-based apps"
+_DESC_SCALING = "Threading, async processing, and scaling ability"
+_DESC_TRAFFIC_CONTROL = "Synchronization, signage, and smart systems"
+_DESC_DISRUPTIONS = "Unexpected disruptions reducing flow"
+_DESC_INTERVIEW_RESEARCH = "Understanding the company and role"
+_DESC_JOB_FIT = "Direct alignment with job requirements"
+_DESC_ATTITUDE = "Showing adaptability and enthusiasm"
+_DESC_VOLCANO_HAZARDS = "Identifying lava flow, ashfall, and lahar zones"
+_DESC_VOLCANO_MONITORING = "Seismic, thermal, and gas detection"
+
+# Display name and description per topic key, kept as a plain literal so help
+# screens can list topics without building the full TOPICS_CONFIG.
+_TOPIC_METADATA: Dict[str, Tuple[str, str]] = {
+    "weather": ("Weather", "Understanding weather patterns and atmospheric conditions"),
+    "software_performance": ("Software Application Performance", "Factors affecting software application efficiency and speed"),
+    "road_traffic": ("Road Traffic", "Factors affecting traffic flow and road congestion"),
+    "job_interview": ("Successful Job Interview", "Key factors for performing well in job interviews"),
+    "volcanic_city_planning": ("City Planning in Volcanic Areas", "Urban planning considerations for volcanic hazard zones"),
+}
+
+TOPICS_METADATA: Tuple[Tuple[str, str], ...] = tuple(_TOPIC_METADATA.values())
+TOPIC_COUNT: int = len(TOPICS_METADATA)
+# Menu entry that selects a random topic, listed after the configured topics
+RANDOM_TOPIC_CHOICE: str = str(TOPIC_COUNT + 1)
+
+def _build_topics_config() -> Mapping[str, Topic]:
+    """Construct every configured topic and its keywords.
+
+    Returns:
+        Read-only mapping of topic keys to Topic instances
+    """
+    return MappingProxyType({
+        "weather": Topic(
+            *_TOPIC_METADATA["weather"],
+            keywords=[
+                Keyword("temperature", "Driven by solar radiation, altitude, and latitude", 1.0),
+                Keyword("humidity", "Amount of moisture in the air affecting comfort and precipitation", 1.0),
+                Keyword("air pressure", "Influences wind and storm systems", 1.0),
+                Keyword("wind patterns", "Caused by pressure differences and Earth's rotation", 1.0),
+                Keyword("precipitation", "Rain, snow, sleet, or hail depending on atmospheric conditions", 1.0),
+            ],
+            introduction="Hey! I've heard that you have some interesting insights about weather patterns. Could you tell me more? What do you think has the biggest influence on weather?"
+        ),
     
-    "software_performance": Topic(
-        name="Software Application Performance",
-        description="Factors affecting software application efficiency and speed",
-        keywords=[
-            Keyword("algorithm efficiency", "Complexity and optimization of code logic", 1.0),
-            Keyword("hardware resources", "CPU speed, memory capacity, and storage performance", 1.0),
-            Keyword("network latency", "Especially for distributed or cloud-based apps", 1.0),
-            Keyword("bandwidth", "Especially for distributed or cloud-based apps", 1.0),
-            Keyword("concurrency", "Threading, async processing, and scaling ability", 1.0),
-            Keyword("load handling", "Threading, async processing, and scaling ability", 1.0),
-            Keyword("database query optimization", "Indexing, caching, and reducing I/O bottlenecks", 1.0),
-        ],
-        introduction="Hey! I've heard that you have some interesting insights about software application performance. Could you tell me more? What do you think has the biggest influence on how fast applications run?"
-    ),
+        "software_performance": Topic(
+            *_TOPIC_METADATA["software_performance"],
+            keywords=[
+                Keyword("algorithm efficiency", "Complexity and optimization of code logic", 1.0),
+                Keyword("hardware resources", "CPU speed, memory capacity, and storage performance", 1.0),
+                Keyword("network latency", _DESC_NETWORK, 1.0),
+                Keyword("bandwidth", _DESC_NETWORK, 1.0),
+                Keyword("concurrency", _DESC_SCALING, 1.0),
+                Keyword("load handling", _DESC_SCALING, 1.0),
+                Keyword("database query optimization", "Indexing, caching, and reducing I/O bottlenecks", 1.0),
+            ],
+            introduction="Hey! I've heard that you have some interesting insights about software application performance. Could you tell me more? What do you think has the biggest influence on how fast applications run?"
+        ),
     
-    "road_traffic": Topic(
-        name="Road Traffic",
-        description="Factors affecting traffic flow and road congestion",
-        keywords=[
-            Keyword("road infrastructure", "Quality, layout, and capacity of roads", 1.0),
-            Keyword("traffic volume", "Number of vehicles and peak-hour surges", 1.0),
-            Keyword("traffic signals", "Synchronization, signage, and smart systems", 1.0),
-            Keyword("traffic control", "Synchronization, signage, and smart systems", 1.0),
-            Keyword("accidents", "Unexpected disruptions reducing flow", 1.0),
-            Keyword("roadworks", "Unexpected disruptions reducing flow", 1.0),
-            Keyword("weather conditions", "Rain, snow, and fog affecting speed and safety", 1.0),
-        ],
-        introduction="Hey! I've heard that you have some interesting insights about road traffic and what causes congestion. Could you tell me more? What do you think has the biggest influence on traffic flow?"
-    ),
+        "road_traffic": Topic(
+            *_TOPIC_METADATA["road_traffic"],
+            keywords=[
+                Keyword("road infrastructure", "Quality, layout, and capacity of roads", 1.0),
+                Keyword("traffic volume", "Number of vehicles and peak-hour surges", 1.0),
+                Keyword("traffic signals", _DESC_TRAFFIC_CONTROL, 1.0),
+                Keyword("traffic control", _DESC_TRAFFIC_CONTROL, 1.0),
+                Keyword("accidents", _DESC_DISRUPTIONS, 1.0),
+                Keyword("roadworks", _DESC_DISRUPTIONS, 1.0),
+                Keyword("weather conditions", "Rain, snow, and fog affecting speed and safety", 1.0),
+            ],
+            introduction="Hey! I've heard that you have some interesting insights about road traffic and what causes congestion. Could you tell me more? What do you think has the biggest influence on traffic flow?"
+        ),
     
-    "job_interview": Topic(
-        name="Successful Job Interview",
-        description="Key factors for performing well in job interviews",
-        keywords=[
-            Keyword("preparation", "Understanding the company and role", 1.0),
-            Keyword("research", "Understanding the company and role", 1.0),
-            Keyword("communication skills", "Clear, concise, and confident speaking", 1.0),
-            Keyword("body language", "Eye contact, posture, and facial expressions", 1.0),
-            Keyword("relevant experience", "Direct alignment with job requirements", 1.0),
-            Keyword("skills", "Direct alignment with job requirements", 1.0),
-            Keyword("positive attitude", "Showing adaptability and enthusiasm", 1.0),
-            Keyword("cultural fit", "Showing adaptability and enthusiasm", 1.0),
-        ],
-        introduction="Hey! I've heard that you have some interesting insights about what makes job interviews successful. Could you tell me more? What do you think has the biggest influence on interview success?"
-    ),
+        "job_interview": Topic(
+            *_TOPIC_METADATA["job_interview"],
+            keywords=[
+                Keyword("preparation", _DESC_INTERVIEW_RESEARCH, 1.0),
+                Keyword("research", _DESC_INTERVIEW_RESEARCH, 1.0),
+                Keyword("communication skills", "Clear, concise, and confident speaking", 1.0),
+                Keyword("body language", "Eye contact, posture, and facial expressions", 1.0),
+                Keyword("relevant experience", _DESC_JOB_FIT, 1.0),
+                Keyword("skills", _DESC_JOB_FIT, 1.0),
+                Keyword("positive attitude", _DESC_ATTITUDE, 1.0),
+                Keyword("cultural fit", _DESC_ATTITUDE, 1.0),
+            ],
+            introduction="Hey! I've heard that you have some interesting insights about what makes job interviews successful. Could you tell me more? What do you think has the biggest influence on interview success?"
+        ),
     
-    "volcanic_city_planning": Topic(
-        name="City Planning in Volcanic Areas",
-        description="Urban planning considerations for volcanic hazard zones",
-        keywords=[
-            Keyword("hazard mapping", "Identifying lava flow, ashfall, and lahar zones", 1.0),
-            Keyword("lava flow", "Identifying lava flow, ashfall, and lahar zones", 1.0),
-            Keyword("ashfall", "Identifying lava flow, ashfall, and lahar zones", 1.0),
-            Keyword("lahar", "Identifying lava flow, ashfall, and lahar zones", 1.0),
-            Keyword("evacuation routes", "Multiple, well-marked, and easily accessible", 1.0),
-            Keyword("land use zoning", "Keeping high-risk zones free of permanent settlements", 1.0),
-            Keyword("monitoring systems", "Seismic, thermal, and gas detection", 1.0),
-            Keyword("early warning systems", "Seismic, thermal, and gas detection", 1.0),
-            Keyword("emergency infrastructure", "Shelters, supply depots, and medical facilities", 1.0),
-        ],
-        introduction="Hey! I've heard that you have some interesting insights about city planning in volcanic areas. Could you tell me more? What do you think has the biggest influence on safe urban development near volcanoes?"
-    )
+        "volcanic_city_planning": Topic(
+            *_TOPIC_METADATA["volcanic_city_planning"],
+            keywords=[
+                Keyword("hazard mapping", _DESC_VOLCANO_HAZARDS, 1.0),
+                Keyword("lava flow", _DESC_VOLCANO_HAZARDS, 1.0),
+                Keyword("ashfall", _DESC_VOLCANO_HAZARDS, 1.0),
+                Keyword("lahar", _DESC_VOLCANO_HAZARDS, 1.0),
+                Keyword("evacuation routes", "Multiple, well-marked, and easily accessible", 1.0),
+                Keyword("land use zoning", "Keeping high-risk zones free of permanent settlements", 1.0),
+                Keyword("monitoring systems", _DESC_VOLCANO_MONITORING, 1.0),
+                Keyword("early warning systems", _DESC_VOLCANO_MONITORING, 1.0),
+                Keyword("emergency infrastructure", "Shelters, supply depots, and medical facilities", 1.0),
+            ],
+            introduction="Hey! I've heard that you have some interesting insights about city planning in volcanic areas. Could you tell me more? What do you think has the biggest influence on safe urban development near volcanoes?"
+        )
+    })
+
+def _build_topics() -> Tuple[Topic, ...]:
+    """Build the ordered sequence of configured topics.
+
+    Returns:
+        Tuple of Topic instances in TOPICS_CONFIG order
+    """
+    return tuple(_lazy("TOPICS_CONFIG").values())
+
+def _build_keyword_automaton() -> ahocorasick.Automaton:
+    """Build an Aho-Corasick automaton over every casefolded keyword term.
+
+    Scanning a text with the automaton finds all terms in a single pass,
+    independent of how many keywords are configured.
+
+    Returns:
+        Automaton whose values are the matched casefolded terms
+    """
+    automaton = ahocorasick.Automaton()
+    for topic in _lazy("TOPICS_CONFIG").values():
+        for kw in topic.keywords:
+            automaton.add_word(kw.term_key, kw.term_key)
+    automaton.make_automaton()
+    return automaton
+
+# Module attributes built on first access (PEP 562), so importing this module
+# stays cheap for code paths that never touch the full topic configuration.
+_LAZY_ATTRS: Dict[str, Callable[[], Any]] = {
+    "TOPICS_CONFIG": _build_topics_config,
+    "TOPICS": _build_topics,
+    "KEYWORD_AUTOMATON": _build_keyword_automaton,
 }
 
+TOPICS_CONFIG: Mapping[str, Topic]
+TOPICS: Tuple[Topic, ...]
+KEYWORD_AUTOMATON: ahocorasick.Automaton
+
+def __getattr__(name: str) -> Any:
+    """Build a lazy module attribute on first access and cache it.
+
+    Args:
+        name: Attribute name being looked up
+
+    Returns:
+        The built attribute value
+
+    Raises:
+        AttributeError: If the name is not a lazy attribute of this module
+    """
+    builder = _LAZY_ATTRS.get(name)
+    if builder is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = globals()[name] = builder()
+    return value
+
+def _lazy(name: str) -> Any:
+    """Return a lazy module attribute from inside this module.
+
+    Module-level ``__getattr__`` only applies to external attribute access,
+    so in-module code goes through this helper instead of the bare name.
+    """
+    if name in globals():
+        return globals()[name]
+    return __getattr__(name)
+
+def find_keyword_terms(text: str) -> set:
+    """Find every configured keyword term occurring in the text.
+
+    Args:
+        text: Text to scan (matched case-insensitively)
+
+    Returns:
+        Set of casefolded keyword terms found as substrings of the text
+    """
+    return {term for _, term in _lazy("KEYWORD_AUTOMATON").iter(text.casefold())}
+
 def get_random_topic() -> Topic:
     """Select a random topic from the available configurations.
     
     Returns:
         Randomly selected Topic instance
     """
-    return random.choice(list(TOPICS_CONFIG.values()))
+    return random.choice(_lazy("TOPICS"))
@@ -1,17 +1,17 @@
-import argparse
 import sys
-from pathlib import Path
+from functools import lru_cache
 
-from src.chatbot import RolePlayChatbot
-from config.config import TOPICS_CONFIG
 from src.helpers.dir_helper import DirectoryHelper
 from src.logger import LOG
 from src.utils import get_conf
 
 
+_STORAGE_PATH = DirectoryHelper.STORAGE_DIR
+
+
 def create_directories():
 
-    Path(DirectoryHelper.PROJECT_DIR + '/storage').mkdir(exist_ok=True)
+    _STORAGE_PATH.mkdir(exist_ok=True)
     LOG.info("Created storage directory for saving data")
 
 def display_banner():
@@ -32,14 +32,7 @@ def display_banner():
 """
     print(banner)
 
-def display_help():
-    help_text = """
-    AVAILABLE TOPICS:"""
-    for i, (key, topic) in enumerate(TOPICS_CONFIG.items(), 1):
-        help_text += f"  {i}. {topic.name}\n"
-        help_text += f"     {topic.description}\n\n"
-    
-    help_text += """
+_HELP_USAGE_TEXT = """
     HOW TO USE:
     1. Choose your input mode (Text or Speech)
     2. Choose a topic from the list
@@ -69,36 +62,76 @@ def display_help():
     - Provide specific examples and details
     - Explain relationships between concepts
     """
-    print(help_text)
+
+@lru_cache(maxsize=None)
+def _render_help():
+    """Render the help screen once; topics are static for the process lifetime."""
+    from config.config import TOPICS_METADATA
+
+    parts = ["""
+    AVAILABLE TOPICS:"""]
+    parts.extend(
+        f"  {i}. {name}\n     {description}\n\n"
+        for i, (name, description) in enumerate(TOPICS_METADATA, 1)
+    )
+    parts.append(_HELP_USAGE_TEXT)
+    return "".join(parts)
+
+def display_help():
+    print(_render_help())
+
+_MENU_TEXT = "\n".join([
+    "Choose your preferred input mode:",
+    "1. Text Mode - Type your responses",
+    "2. Speech Mode - Speak your responses (requires microphone)",
+    "3. Help - Show detailed information",
+    "4. Exit",
+    "",
+])
+
+def _select_text_mode():
+    LOG.info("Text mode selected")
+    return True  # text_mode = True
+
+def _select_speech_mode():
+    LOG.info("Speech mode selected")
+    return False  # text_mode = False
+
+def _show_help():
+    display_help()
+    return None  # keep asking
+
+def _exit_app():
+    LOG.info("Goodbye!")
+    sys.exit(0)
+
+_INPUT_MODE_HANDLERS = {
+    "1": _select_text_mode,
+    "2": _select_speech_mode,
+    "3": _show_help,
+    "4": _exit_app,
+}
 
 def select_input_mode():
     """Interactive mode selection when no command line arguments are provided"""
     LOG.info("SELECT INPUT MODE")
     
     while True:
-        LOG.info("Choose your preferred input mode:")
-        LOG.info("1. Text Mode - Type your responses")
-        LOG.info("2. Speech Mode - Speak your responses (requires microphone)")
-        LOG.info("3. Help - Show detailed information")
-        LOG.info("4. Exit")
+        # Menu is UI, not a log event: write it in one buffered call
+        sys.stdout.write(_MENU_TEXT)
+        sys.stdout.flush()
         
         try:
             choice = input("\nEnter your choice (1-4): ").strip()
             
-            if choice == "1":
-                LOG.info("Text mode selected")
-                return True  # text_mode = True
-            elif choice == "2":
-                LOG.info("Speech mode selected")
-                return False  # text_mode = False
-            elif choice == "3":
-                display_help()
-                continue
-            elif choice == "4":
-                LOG.info("Goodbye!")
-                sys.exit(0)
-            else:
+            handler = _INPUT_MODE_HANDLERS.get(choice)
+            if handler is None:
                 LOG.info("Invalid choice. Please enter 1, 2, 3, or 4.")
+                continue
+            
+            text_mode = handler()
+            if text_mode is not None:
+                return text_mode
                 
         except KeyboardInterrupt:
             LOG.error("Application interrupted by user. Goodbye!")
@@ -106,7 +139,10 @@ def select_input_mode():
         except Exception:
             LOG.error("Invalid input. Please try again.")
 
-def main():
+def parse_args():
+    """Parse command line flags; argparse is only imported when flags are given."""
+    import argparse
+
     parser = argparse.ArgumentParser(
         description="AI-Powered Chatbot for Knowledge Evaluation",
         epilog="""
@@ -143,7 +179,41 @@ def main():
         help="List saved conversation sessions"
     )
     
-    args = parser.parse_args()
+    return parser.parse_args()
+
+def run_chatbot(model, text_mode):
+    LOG.info(f"Model: {model}")
+    LOG.info(f"{'💬' if text_mode else '🎤'} Mode: {'Text' if text_mode else 'Speech'} Input")
+    
+    try:
+        from src.chatbot import RolePlayChatbot
+
+        chatbot = RolePlayChatbot(
+            api_key=get_conf("OPENAI_API_KEY"),
+            model=get_conf('MODEL_NAME'),
+            use_speech=not text_mode
+        )
+        if text_mode:
+            chatbot.run_text_only_mode()
+        else:
+            chatbot.run_conversation()
+            
+    except KeyboardInterrupt:
+        LOG.info("Application interrupted by user. Goodbye!")
+    except Exception as e:
+        LOG.error(f"An unexpected error occurred: {e}")
+        LOG.error("Please check your configuration and try again.")
+        sys.exit(1)
+
+def main():
+    if len(sys.argv) == 1:  # No arguments provided, no need for argparse
+        display_banner()
+        create_directories()
+        text_mode = select_input_mode()
+        run_chatbot(get_conf('MODEL_NAME'), text_mode)
+        return
+    
+    args = parse_args()
     
     if args.help_topics:
         display_help()
@@ -169,33 +239,9 @@ def main():
         LOG.info(f"Model: {args.model}")
         LOG.info("Mode: Text Input")
     else:
-        import sys
-        if len(sys.argv) == 1:  # No arguments provided
-            text_mode = select_input_mode()
-        else:
-            text_mode = False
-        
-    LOG.info(f"Model: {args.model}")
-    LOG.info(f"{'💬' if text_mode else '🎤'} Mode: {'Text' if text_mode else 'Speech'} Input")
+        text_mode = False
     
-    try:
-        chatbot = RolePlayChatbot(
-            api_key=get_conf("OPENAI_API_KEY"),
-            model=get_conf('MODEL_NAME'),
-            use_speech=not text_mode
-        )
-        if text_mode:
-            chatbot.run_text_only_mode()
-        else:
-            chatbot.run_conversation()
-            
-    except KeyboardInterrupt:
-        LOG.info("Application interrupted by user. Goodbye!")
-    except Exception as e:
-        LOG.error(f"An unexpected error occurred: {e}")
-        LOG.error("Please check your configuration and try again.")
-        import sys
-        sys.exit(1)
+    run_chatbot(args.model, text_mode)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
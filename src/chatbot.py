@@ -1,10 +1,81 @@
-import time
+import queue
+import re
+import string
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 
+from src.helpers.http_helper import HttpHelper
 from src.logger import LOG
-from src.speech_handler import SpeechHandler
-from src.llm_client import LLMClient
+from src.llm_client import FALLBACK_FOLLOW_UP_QUESTION, LLMClient
 from src.conversation_manager import ConversationManager
-from config.config import get_random_topic, TOPICS_CONFIG
+from config.config import get_random_topic, RANDOM_TOPIC_CHOICE, TOPIC_COUNT, TOPICS, TOPICS_METADATA
+
+_DIGITS_RE = re.compile(r'\d+')
+_EXIT_RE = re.compile(r'\b(?:quit|exit|stop|end)\b', re.IGNORECASE)
+_AFFIRMATIVE_WORDS = frozenset({'yes', 'y', 'yeah', 'yep', 'sure', 'ok', 'okay'})
+_WORD_TO_NUM = {
+    'zero': 0, 'one': 1, 'two': 2, 'three': 3, 'four': 4,
+    'five': 5, 'six': 6, 'seven': 7, 'eight': 8, 'nine': 9,
+    'ten': 10, 'eleven': 11, 'twelve': 12, 'thirteen': 13,
+    'fourteen': 14, 'fifteen': 15, 'sixteen': 16, 'seventeen': 17,
+    'eighteen': 18, 'nineteen': 19, 'twenty': 20
+}
+# Maps punctuation to spaces so "Yes." or "sure!" split into plain words
+_PUNCTUATION_TO_SPACE = str.maketrans(string.punctuation, ' ' * len(string.punctuation))
+# Topics are static for the process lifetime, so the menu is formatted once
+_TOPIC_MENU_TEXT = "\n".join([
+    "Available Topics:",
+    *(f"  {i}. {name}\n     {description}" for i, (name, description) in enumerate(TOPICS_METADATA, 1)),
+    f"  {RANDOM_TOPIC_CHOICE}. Random Topic",
+])
+# Streamed replies are spoken in chunks that end at a sentence boundary, at a
+# comma once the chunk has enough words, or at the last space before the
+# length cap (~80 tokens at ~4 characters per token)
+_CHUNK_BOUNDARY_RE = re.compile(r'(?<=[.?!,])\s+')
+_SPEECH_CHUNK_MIN_WORDS = 4
+_SPEECH_CHUNK_MAX_CHARS = 320
+
+
+def _split_speech_chunks(text):
+    """Split streamed text into chunks ready to speak and the unfinished rest.
+    
+    Args:
+        text (str): Text received so far that has not been spoken yet
+        
+    Returns:
+        tuple: (list of complete chunks, remaining text)
+    """
+    chunks = []
+    start = 0
+    for match in _CHUNK_BOUNDARY_RE.finditer(text):
+        chunk = text[start:match.start()]
+        if chunk.endswith(',') and len(chunk.split()) < _SPEECH_CHUNK_MIN_WORDS:
+            continue
+        chunks.append(chunk)
+        start = match.end()
+    
+    rest = text[start:]
+    while len(rest) > _SPEECH_CHUNK_MAX_CHARS:
+        cut = rest.rfind(' ', 0, _SPEECH_CHUNK_MAX_CHARS)
+        if cut <= 0:
+            cut = _SPEECH_CHUNK_MAX_CHARS
+        chunks.append(rest[:cut])
+        rest = rest[cut:].lstrip()
+    return chunks, rest
+
+
+def _create_speech_handler():
+    """Import and build the speech handler.
+    
+    The import pulls in PyAudio, pygame and the audio setup, so it is
+    deferred until speech mode actually needs it.
+    
+    Returns:
+        SpeechHandler: A ready speech handler
+    """
+    from src.speech_handler import SpeechHandler
+    return SpeechHandler()
 
 
 class RolePlayChatbot:
@@ -19,11 +90,23 @@ class RolePlayChatbot:
             model: Model name to use (e.g., 'gpt-3.5-turbo')
             use_speech: Enable speech input/output functionality
         """
-        self.speech_handler = SpeechHandler() if use_speech else None
-        self.llm_client = LLMClient(api_key, model)
-        self.conversation_manager = ConversationManager()
+        # Shared worker pool for all background work of this chatbot
+        self._pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="chatbot")
+        
+        # Audio device, OpenAI and LangChain client setup are independent
+        speech_future = self._pool.submit(_create_speech_handler) if use_speech else None
+        llm_future = self._pool.submit(LLMClient, api_key, model)
+        manager_future = self._pool.submit(ConversationManager)
+        self.speech_handler = speech_future.result() if speech_future else None
+        self.llm_client = llm_future.result()
+        self.conversation_manager = manager_future.result()
         self.use_speech = use_speech
         self.current_topic = None
+        # Console reader thread, started on first text input
+        self._prompt_queue = queue.Queue()
+        self._text_input_queue = queue.Queue()
+        self._input_thread = None
+        self._input_pending = False
         LOG.info("AI Chatbot initialized")
     
         
@@ -32,30 +115,18 @@ class RolePlayChatbot:
         
         Shows a numbered list of available topics plus random option.
         """
-        LOG.info("Available Topics:")
-        for i, topic in enumerate(TOPICS_CONFIG.values(), 1):
-            LOG.info(f"  {i}. {topic.name}")
-        LOG.info(f"  {len(TOPICS_CONFIG) + 1}. Random Topic")
+        LOG.info(_TOPIC_MENU_TEXT)
     
     def _convert_word_to_number(self, word):
         """Convert spoken number words to digits.
         
         Args:
-            word (str): The word to convert
+            word (str): The word to convert, already lowercased and stripped
             
         Returns:
             int: The numeric value, or None if conversion fails
         """
-        word_to_num = {
-            'zero': 0, 'one': 1, 'two': 2, 'three': 3, 'four': 4, 
-            'five': 5, 'six': 6, 'seven': 7, 'eight': 8, 'nine': 9,
-            'ten': 10, 'eleven': 11, 'twelve': 12, 'thirteen': 13, 
-            'fourteen': 14, 'fifteen': 15, 'sixteen': 16, 'seventeen': 17,
-            'eighteen': 18, 'nineteen': 19, 'twenty': 20
-        }
-        
-        word_lower = word.lower().strip()
-        return word_to_num.get(word_lower)
+        return _WORD_TO_NUM.get(word)
 
     def get_topic(self):
         """Get user's topic selection via speech or text input.
@@ -70,22 +141,37 @@ class RolePlayChatbot:
                 "Say the number of the topic you'd like to discuss", timeout=15
             )
         else:
-            choice = input("Enter topic number: ").strip()
+            choice = self._read_text_input("Enter topic number: ")
         
         if not choice:
             return None
             
-        if 'random' in choice.lower() or choice == str(len(TOPICS_CONFIG) + 1):
-            return get_random_topic()
+        return self._parse_topic_choice(choice)
+    
+    def _parse_topic_choice(self, choice):
+        """Map a typed or spoken topic choice to a topic.
+        
+        Accepts "random", a number anywhere in the input (e.g. "topic 2"),
+        or a spoken number word.
+        
+        Args:
+            choice (str): The user's topic choice
             
-        try:
-            num = int(choice)
-            if 1 <= num <= len(TOPICS_CONFIG):
-                return list(TOPICS_CONFIG.values())[num - 1]
-        except ValueError:
-            num = self._convert_word_to_number(choice)
-            if num is not None and 1 <= num <= len(TOPICS_CONFIG):
-                return list(TOPICS_CONFIG.values())[num - 1]
+        Returns:
+            Topic: Selected topic object, or None if the choice is invalid
+        """
+        choice = choice.lower()
+        if 'random' in choice or choice == RANDOM_TOPIC_CHOICE:
+            return get_random_topic()
+        
+        match = _DIGITS_RE.search(choice)
+        num = int(match.group()) if match else self._convert_word_to_number(choice)
+        
+        if num is not None:
+            if 1 <= num <= TOPIC_COUNT:
+                return TOPICS[num - 1]
+            if num == TOPIC_COUNT + 1:
+                return get_random_topic()
             
         LOG.warning("Invalid topic selection")
         return None
@@ -116,8 +202,77 @@ class RolePlayChatbot:
         """
         LOG.info(f"AI: {message}")
         if self.use_speech and self.speech_handler:
-            self.speech_handler.speak(message)
-            time.sleep(0.5)
+            # Wait for playback to end so we don't start listening over it
+            self.speech_handler.speak(message).join()
+    
+    def stream_message(self, deltas):
+        """Deliver a streamed message, speaking each chunk as soon as it is complete.
+        
+        Complete chunks go onto a queue drained by a single playback worker, so
+        reading the stream never waits for speech and chunks play in order.
+        The call returns once playback has finished; the full message is
+        logged once streaming ends.
+        
+        Args:
+            deltas: Iterable of text fragments, e.g. from LLMClient streaming
+            
+        Returns:
+            str: The complete message, stripped
+        """
+        speak = self.use_speech and self.speech_handler
+        parts = []
+        pending = ""
+        
+        if speak:
+            chunks = queue.Queue()
+            playback = self._pool.submit(self._play_chunks, chunks)
+        
+        try:
+            for delta in deltas:
+                parts.append(delta)
+                if speak:
+                    complete, pending = _split_speech_chunks(pending + delta)
+                    for chunk in complete:
+                        chunks.put(chunk)
+        except Exception:
+            if speak:
+                # The reply is cut off; drop the chunks not spoken yet
+                self._discard_chunks(chunks)
+            raise
+        else:
+            if speak and pending.strip():
+                chunks.put(pending)
+        finally:
+            if speak:
+                chunks.put(None)
+                playback.result()
+        
+        message = "".join(parts).strip()
+        if message:
+            LOG.info(f"AI: {message}")
+        return message
+    
+    def _play_chunks(self, chunks):
+        """Playback worker: speak queued chunks in order until a None entry.
+        
+        Args:
+            chunks (queue.Queue): Text chunks to speak, ended by None
+        """
+        for text in iter(chunks.get, None):
+            self.speech_handler.speak(text.strip()).join()
+    
+    @staticmethod
+    def _discard_chunks(chunks):
+        """Remove every chunk still waiting in a playback queue.
+        
+        Args:
+            chunks (queue.Queue): Playback queue to empty
+        """
+        while True:
+            try:
+                chunks.get_nowait()
+            except queue.Empty:
+                return
     
     def get_user_input(self):
         """Get user input via speech or text.
@@ -129,10 +284,49 @@ class RolePlayChatbot:
             return self.speech_handler.get_speech_input("", timeout=15)
         else:
             try:
-                return input("USER INPUT: ").strip()
+                return self._read_text_input("USER INPUT: ")
             except KeyboardInterrupt:
                 return None
     
+    def _read_text_input(self, prompt):
+        """Read a line from the console without blocking the main thread in input().
+        
+        The blocking input() call runs on a daemon reader thread and the line is
+        handed back through a queue, so the main thread waits in a cancellable
+        queue.get() (Ctrl+C is delivered immediately). A read interrupted that
+        way stays pending on the reader thread; the next call shows its own
+        prompt again and takes the line from that read.
+        
+        Args:
+            prompt (str): Prompt to show
+            
+        Returns:
+            str: The stripped line, or None at end of input
+        """
+        if self._input_thread is None:
+            self._input_thread = threading.Thread(target=self._input_worker, daemon=True)
+            self._input_thread.start()
+        
+        if self._input_pending:
+            print(prompt, end="", flush=True)
+        else:
+            self._prompt_queue.put(prompt)
+            self._input_pending = True
+        
+        line = self._text_input_queue.get()
+        self._input_pending = False
+        return line.strip() if line is not None else None
+    
+    def _input_worker(self):
+        """Reader thread body: read one console line per queued prompt."""
+        while True:
+            prompt = self._prompt_queue.get()
+            try:
+                line = input(prompt)
+            except EOFError:
+                line = None
+            self._text_input_queue.put(line)
+    
     def handle_response(self, user_input):
         """Process user input and generate appropriate AI response.
 
@@ -158,21 +352,19 @@ class RolePlayChatbot:
             return False
 
         try:
-            llm_response = self.llm_client.generate_follow_up_question(
-                self.current_topic, user_input, current_score
+            llm_response = self.stream_message(
+                self.llm_client.stream_follow_up_question(self.current_topic, user_input, current_score)
             )
-            
-            if llm_response:
-                self.send_message(llm_response)
-                self.conversation_manager.add_turn("assistant", llm_response)
-            else:
-                fallback = "That's interesting! Can you tell me more about what you think influences this the most?"
-                self.send_message(fallback)
-                self.conversation_manager.add_turn("assistant", fallback)
-                
         except Exception as e:
+            # A reply cut off by an API error is dropped for the fallback question
             LOG.error(f"Error: {e}")
-            self.send_message("I'd love to hear more about your thoughts on this topic!")
+            llm_response = ""
+        
+        if llm_response:
+            self.conversation_manager.add_turn("assistant", llm_response)
+        else:
+            self.send_message(FALLBACK_FOLLOW_UP_QUESTION)
+            self.conversation_manager.add_turn("assistant", FALLBACK_FOLLOW_UP_QUESTION)
 
         return True
     
@@ -184,12 +376,16 @@ class RolePlayChatbot:
         """
         LOG.info("Welcome to the AI Chatbot!")
         
+        # Check the API connection while the user runs through the audio test
+        connection_future = self._pool.submit(self.llm_client.test_connection)
+        
         if self.use_speech and not self.speech_handler.test_audio_system():
             LOG.error("Audio test failed. Using text mode.")
             self.use_speech = False
         
-        if not self.llm_client.test_connection():
+        if not connection_future.result():
             LOG.error("Cannot connect to AI service.")
+            self._cleanup()
             return
         
         while True:
@@ -209,8 +405,7 @@ class RolePlayChatbot:
                     if not user_input:
                         break
                     
-                    exit_words = ['quit', 'exit', 'stop', 'end']
-                    if any(word in user_input.lower() for word in exit_words):
+                    if self._is_exit_request(user_input):
                         LOG.info("Conversation ended.")
                         break
                     
@@ -229,8 +424,28 @@ class RolePlayChatbot:
                 break
         
         LOG.info("Goodbye!")
+        self._cleanup()
+    
+    def _cleanup(self):
+        """Release the API connection pool, audio resources and worker pool."""
+        HttpHelper.close()
         if self.use_speech and self.speech_handler:
             self.speech_handler.cleanup()
+        self._pool.shutdown(wait=False, cancel_futures=True)
+    
+    @staticmethod
+    def _is_exit_request(user_input):
+        """Check whether the user asked to end the conversation.
+        
+        Matches whole words only, so e.g. "weekend" or "depend" do not end it.
+        
+        Args:
+            user_input (str): The user's input message
+            
+        Returns:
+            bool: True if the input contains one of the quit words
+        """
+        return _EXIT_RE.search(user_input) is not None
     
     def ask_yes_no(self, question):
         """Ask user a yes/no question via speech or text.
@@ -244,12 +459,13 @@ class RolePlayChatbot:
         if self.use_speech and self.speech_handler:
             response = self.speech_handler.get_speech_input(f"{question} Say yes or no.", timeout=10)
         else:
-            response = input(f"{question} (y/n): ").strip().lower()
+            response = self._read_text_input(f"{question} (y/n): ")
         
         if not response:
             return False
         
-        return 'yes' in response.lower() or response.lower() in ['y', 'yeah', 'yep', 'sure']
+        words = response.lower().translate(_PUNCTUATION_TO_SPACE).split()
+        return any(word in _AFFIRMATIVE_WORDS for word in words)
     
     def show_results(self, session_data):
         """Display conversation results and scoring information.
@@ -260,17 +476,21 @@ class RolePlayChatbot:
         if not session_data:
             return
 
-        LOG.info("CONVERSATION RESULTS")
-        LOG.info(f"Topic: {session_data['topic']}")
-        LOG.info(f"Duration: {session_data['duration_minutes']:.1f} minutes")
-        LOG.info(f"Score: {session_data['final_score']:.1f}/100")
-        
+        # One log record for the whole block rather than one per line
+        lines = [
+            "CONVERSATION RESULTS",
+            f"Topic: {session_data['topic']}",
+            f"Duration: {session_data['duration_minutes']:.1f} minutes",
+            f"Score: {session_data['final_score']:.1f}/100",
+        ]
+
         if 'scoring_details' in session_data:
             details = session_data['scoring_details']
             if details['keyword_matches']:
-                LOG.info("Topics covered:")
-                for keyword in list(details['keyword_matches'].keys())[:3]:
-                    LOG.info(f"  • {keyword.title()}")
+                lines.append("Topics covered:")
+                lines.extend(f"  • {keyword.title()}" for keyword in islice(details['keyword_matches'], 3))
+
+        LOG.info("\n".join(lines))
 
     
     def run_text_only_mode(self):
@@ -1,54 +1,63 @@
 from datetime import datetime, timedelta
-from typing import List, Dict, Optional, Tuple
+import os
+import time
+from itertools import islice
+from typing import IO, List, Dict, Optional, Tuple
 from dataclasses import dataclass, field
-import json
+import orjson
 from pathlib import Path
 
 from config.config import Topic
 from src.helpers.dir_helper import DirectoryHelper
-from src.keyword_analyzer import KeywordAnalyzer, ScoringResult
+from src.keyword_analyzer import IncrementalScoreState, KeywordAnalyzer, ScoringResult
 from src.logger import LOG
 
 
-@dataclass
+def _isoformat(timestamp: float) -> str:
+    """Format a Unix timestamp as a local ISO 8601 string."""
+    return datetime.fromtimestamp(timestamp).isoformat()
+
+@dataclass(slots=True)
 class ConversationTurn:
     """Represents a single turn in a conversation.
     
     Attributes:
-        timestamp: When this turn occurred
+        timestamp: When this turn occurred (Unix time)
         speaker: Either 'user' or 'assistant'
         content: The actual message content
         score: Optional relevance score for user turns
         keyword_matches: Dictionary of matched keywords and their scores
     """
-    timestamp: datetime
+    timestamp: float
     speaker: str  # "user" or "assistant"
     content: str
     score: Optional[float] = None
     keyword_matches: Dict = field(default_factory=dict)
 
-@dataclass
+@dataclass(slots=True)
 class ConversationSession:
     """Represents a complete conversation session on a specific topic.
     
     Attributes:
         session_id: Unique identifier for this session
         topic: The conversation topic being discussed
-        start_time: When the session began
-        end_time: When the session ended (None if still active)
+        start_time: When the session began (Unix time)
+        end_time: When the session ended (Unix time, None if still active)
         turns: List of all conversation turns
         final_score: Final calculated score for the session
         total_user_words: Total word count from user messages
         session_summary: Brief summary of the session
+        score_state: Running keyword coverage of the user turns
     """
     session_id: str
     topic: Topic
-    start_time: datetime
-    end_time: Optional[datetime] = None
+    start_time: float
+    end_time: Optional[float] = None
     turns: List[ConversationTurn] = field(default_factory=list)
     final_score: Optional[float] = None
     total_user_words: int = 0
     session_summary: str = ""
+    score_state: IncrementalScoreState = field(default_factory=IncrementalScoreState)
 
 class ConversationManager:
     """Manages conversation sessions, scoring, and persistence.
@@ -67,31 +76,21 @@ class ConversationManager:
             save_conversations: Whether to save conversations to disk
         """
         self.current_session: Optional[ConversationSession] = None
+        self.user_turn_count = 0
+        # Scoring data of the last analysis and the user turn count it covers;
+        # only a new user turn changes the score
+        self._cached_scoring: Tuple[float, Optional[ScoringResult], float] = (0.0, None, 0.0)
+        self._cached_user_turn_count = 0
         self.keyword_analyzer = KeywordAnalyzer()
         self.save_conversations = save_conversations
-        self.conversations_dir = Path(DirectoryHelper.STORAGE_DIR + '/conversations')
+        self.conversations_dir = DirectoryHelper.STORAGE_DIR / "conversations"
+        # Append-only JSONL log of the current session: a start record, one
+        # line per turn as it happens, and an end record with the results
+        self._session_fp: Optional[IO[bytes]] = None
         
         if save_conversations:
             self.conversations_dir.mkdir(exist_ok=True)
     
-    def _get_user_turns(self) -> List[ConversationTurn]:
-        """Get all user turns from the current session.
-        
-        Returns:
-            List of user conversation turns, empty if no active session
-        """
-        if not self.current_session:
-            return []
-        return [t for t in self.current_session.turns if t.speaker == "user"]
-    
-    def _get_user_messages(self) -> List[str]:
-        """Get user message content from all turns.
-        
-        Returns:
-            List of user message strings
-        """
-        return [t.content for t in self._get_user_turns()]
-    
     def _calculate_session_duration(self) -> timedelta:
         """Calculate duration of the current session.
         
@@ -100,7 +99,7 @@ class ConversationManager:
         """
         if not self.current_session:
             return timedelta(0)
-        return datetime.now() - self.current_session.start_time
+        return timedelta(seconds=time.time() - self.current_session.start_time)
     
     def _get_scoring_data(self) -> Tuple[float, Optional[ScoringResult], float]:
         """Get current score, result, and coverage percentage.
@@ -111,14 +110,35 @@ class ConversationManager:
         if not self.current_session:
             return 0.0, None, 0.0
         
-        user_messages = self._get_user_messages()
-        if not user_messages:
-            return 0.0, None, 0.0
-            
-        scoring_result = self.keyword_analyzer.analyze_conversation(user_messages, self.current_session.topic)
-        coverage = (scoring_result.keywords_found / scoring_result.total_keywords) * 100 if scoring_result.total_keywords > 0 else 0.0
+        if self._cached_user_turn_count == self.user_turn_count:
+            return self._cached_scoring
+        
+        scoring_result = self.keyword_analyzer.score_from_state(self.current_session.score_state, self.current_session.topic)
+        self._cache_scoring(scoring_result)
+        return self._cached_scoring
+    
+    def _cache_scoring(self, scoring_result: ScoringResult):
+        """Store scoring data for the current user turn count.
         
-        return scoring_result.total_score, scoring_result, coverage
+        Args:
+            scoring_result: Analysis of all user turns so far
+        """
+        self._cached_scoring = (scoring_result.total_score, scoring_result, self._calculate_coverage(scoring_result))
+        self._cached_user_turn_count = self.user_turn_count
+    
+    @staticmethod
+    def _calculate_coverage(scoring_result: ScoringResult) -> float:
+        """Calculate the percentage of topic keywords covered.
+        
+        Args:
+            scoring_result: Scoring analysis results
+            
+        Returns:
+            Coverage percentage (0-100)
+        """
+        if scoring_result.total_keywords == 0:
+            return 0.0
+        return (scoring_result.keywords_found / scoring_result.total_keywords) * 100
     
     def start_new_session(self, topic: Topic) -> str:
         """Start a new conversation session for the given topic.
@@ -129,14 +149,27 @@ class ConversationManager:
         Returns:
             The unique session ID for the new session
         """
-        session_id = f"{topic.name.lower().replace(' ', '_')}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+        start_time = time.time()
+        session_id = f"{topic.name.lower().replace(' ', '_')}_{time.strftime('%Y%m%d_%H%M%S', time.localtime(start_time))}"
         
         self.current_session = ConversationSession(
             session_id=session_id,
             topic=topic,
-            start_time=datetime.now(),
+            start_time=start_time,
             turns=[]
         )
+        self.user_turn_count = 0
+        self._cached_scoring = (0.0, None, 0.0)
+        self._cached_user_turn_count = 0
+        
+        if self.save_conversations:
+            self._open_session_log(session_id)
+            self._write_record({
+                "record": "start",
+                "session_id": session_id,
+                "topic": topic.name,
+                "start_time": _isoformat(start_time),
+            })
         
         LOG.info(f"Started new conversation session: {session_id}")
         return session_id
@@ -158,21 +191,26 @@ class ConversationManager:
             raise ValueError("No active conversation session")
         
         turn = ConversationTurn(
-            timestamp=datetime.now(),
+            timestamp=time.time(),
             speaker=speaker,
             content=content
         )
         
         if speaker == "user":
-            user_messages = self._get_user_messages() + [content]
-            scoring_result = self.keyword_analyzer.analyze_conversation(user_messages, self.current_session.topic)
+            # Only the new turn is analyzed; earlier turns live in score_state
+            scoring_result = self.keyword_analyzer.update_incremental(
+                self.current_session.score_state, content, self.current_session.topic
+            )
             
             turn.score = scoring_result.total_score
             turn.keyword_matches = {k: v.score for k, v in scoring_result.keyword_matches.items()}
             
             self.current_session.total_user_words += len(content.split())
+            self.user_turn_count += 1
+            self._cache_scoring(scoring_result)
         
         self.current_session.turns.append(turn)
+        self._write_record({"record": "turn", **self._turn_to_dict(turn)})
         return turn.score
     
     def get_current_score(self) -> Tuple[float, ScoringResult]:
@@ -204,38 +242,44 @@ class ConversationManager:
             context.append({
                 "role": turn.speaker,
                 "content": turn.content,
-                "timestamp": turn.timestamp.isoformat()
+                "timestamp": _isoformat(turn.timestamp)
             })
         
         return context
     
-    def get_conversation_summary(self) -> str:
+    def get_conversation_summary(self, scoring_result: Optional[ScoringResult] = None) -> str:
         """Generate a comprehensive summary of the current conversation.
         
+        Args:
+            scoring_result: Scoring results to report; the current scoring
+                data is used when omitted
+        
         Returns:
             Formatted string with session statistics and progress
         """
         if not self.current_session:
             return "No active conversation"
         
-        user_turns = self._get_user_turns()
         duration = self._calculate_session_duration()
-        current_score, scoring_result, coverage = self._get_scoring_data()
+        if scoring_result is not None:
+            current_score, coverage = scoring_result.total_score, self._calculate_coverage(scoring_result)
+        else:
+            current_score, scoring_result, coverage = self._get_scoring_data()
 
-        summary = f"""
+        parts = [f"""
         Conversation Summary - Session: {self.current_session.session_id}
         Topic: {self.current_session.topic.name}
         Duration: {duration.total_seconds()/60:.1f} minutes
         Total turns: {len(self.current_session.turns)}
-        User responses: {len(user_turns)}
+        User responses: {self.user_turn_count}
         Current score: {current_score:.1f}/100
-        Total user words: {self.current_session.total_user_words}"""
+        Total user words: {self.current_session.total_user_words}"""]
         
         if scoring_result:
-            summary += f"\nTopic coverage: {coverage:.1f}%"
-            summary += f"\nKeywords mentioned: {scoring_result.keywords_found}/{scoring_result.total_keywords}"
+            parts.append(f"\nTopic coverage: {coverage:.1f}%")
+            parts.append(f"\nKeywords mentioned: {scoring_result.keywords_found}/{scoring_result.total_keywords}")
         
-        return summary.strip()
+        return "".join(parts).strip()
     
     def should_continue_conversation(self) -> Tuple[bool, str]:
         """Determine if the conversation should continue based on various criteria.
@@ -247,9 +291,7 @@ class ConversationManager:
         if not self.current_session:
             return False, "No active session"
         
-        user_turns = self._get_user_turns()
-        
-        if len(user_turns) < 2:
+        if self.user_turn_count < 2:
             return True, "Continue - need more user input"
         
         current_score, scoring_result, coverage = self._get_scoring_data()
@@ -259,7 +301,7 @@ class ConversationManager:
         if current_score >= 80:
             return False, f"Excellent coverage achieved! Score: {current_score:.1f}/100"
         
-        if len(user_turns) >= 8:
+        if self.user_turn_count >= 8:
             return False, f"Conversation has reached good length. Final score: {current_score:.1f}/100"
         
         if duration > timedelta(minutes=10):
@@ -280,7 +322,7 @@ class ConversationManager:
         if not self.current_session:
             return None
         
-        self.current_session.end_time = datetime.now()
+        self.current_session.end_time = time.time()
         final_score, scoring_result, coverage = self._get_scoring_data()
         self.current_session.final_score = final_score
         
@@ -305,28 +347,19 @@ class ConversationManager:
         Returns:
             Dictionary containing all session data for saving/export
         """
-        user_turns = self._get_user_turns()
-        duration = self.current_session.end_time - self.current_session.start_time
+        duration_seconds = self.current_session.end_time - self.current_session.start_time
         
         session_data = {
             "session_id": self.current_session.session_id,
             "topic": self.current_session.topic.name,
-            "start_time": self.current_session.start_time.isoformat(),
-            "end_time": self.current_session.end_time.isoformat(),
-            "duration_minutes": duration.total_seconds() / 60,
+            "start_time": _isoformat(self.current_session.start_time),
+            "end_time": _isoformat(self.current_session.end_time),
+            "duration_minutes": duration_seconds / 60,
             "final_score": final_score,
             "total_turns": len(self.current_session.turns),
-            "user_turns": len(user_turns),
+            "user_turns": self.user_turn_count,
             "total_user_words": self.current_session.total_user_words,
-            "turns": [
-                {
-                    "timestamp": turn.timestamp.isoformat(),
-                    "speaker": turn.speaker,
-                    "content": turn.content,
-                    "score": turn.score,
-                    "keyword_matches": turn.keyword_matches
-                } for turn in self.current_session.turns
-            ]
+            "turns": [self._turn_to_dict(turn) for turn in self.current_session.turns]
         }
         
         if scoring_result:
@@ -340,37 +373,124 @@ class ConversationManager:
         
         return session_data
     
-    def save_session(self, session_data: Dict):
-        """Save session data to a JSON file.
+    def _turn_to_dict(self, turn: ConversationTurn) -> Dict:
+        """Convert a conversation turn to its saved form.
         
         Args:
-            session_data: Dictionary containing session information to save
+            turn: The turn to convert
+            
+        Returns:
+            Dictionary with the turn's timestamp, speaker, content and scores
         """
-        filename = f"{session_data['session_id']}.json"
-        filepath = self.conversations_dir / filename
+        return {
+            "timestamp": _isoformat(turn.timestamp),
+            "speaker": turn.speaker,
+            "content": turn.content,
+            "score": turn.score,
+            "keyword_matches": turn.keyword_matches
+        }
+    
+    def _session_log_path(self, session_id: str) -> Path:
+        """Get the JSONL file path of a session."""
+        return self.conversations_dir / f"{session_id}.jsonl"
+    
+    def _legacy_session_path(self, session_id: str) -> Path:
+        """Get the path of a session saved as a single JSON document by older versions."""
+        return self.conversations_dir / f"{session_id}.json"
+    
+    def _open_session_log(self, session_id: str):
+        """Open the append-only log for a new session, closing any previous one.
         
+        Args:
+            session_id: The unique identifier of the session
+        """
+        self._close_session_log()
         try:
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(session_data, f, indent=2, ensure_ascii=False)
-            LOG.info(f"Conversation saved to: {filepath}")
+            self._session_fp = open(self._session_log_path(session_id), 'ab')
+        except Exception as e:
+            LOG.error(f"Error opening conversation log: {e}")
+    
+    def _close_session_log(self):
+        """Close the current session log, if one is open."""
+        if self._session_fp is not None:
+            self._session_fp.close()
+            self._session_fp = None
+    
+    def _write_record(self, record: Dict):
+        """Append one record to the current session log.
+        
+        Args:
+            record: JSON-serializable record to write as a single line
+        """
+        if self._session_fp is None:
+            return
+        try:
+            self._session_fp.write(orjson.dumps(record, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE))
+            self._session_fp.flush()
         except Exception as e:
             LOG.error(f"Error saving conversation: {e}")
     
+    def save_session(self, session_data: Dict):
+        """Save session data to the session's JSONL file.
+        
+        Turns are already in the log when the session was recorded live, so
+        only the end record is appended; otherwise the whole session is written.
+        
+        Args:
+            session_data: Dictionary containing session information to save
+        """
+        filepath = self._session_log_path(session_data['session_id'])
+        
+        if self._session_fp is None:
+            self._open_session_log(session_data['session_id'])
+            self._write_record({
+                "record": "start",
+                "session_id": session_data['session_id'],
+                "topic": session_data['topic'],
+                "start_time": session_data['start_time'],
+            })
+            for turn in session_data.get('turns', []):
+                self._write_record({"record": "turn", **turn})
+        
+        summary = {k: v for k, v in session_data.items() if k != 'turns'}
+        self._write_record({"record": "end", **summary})
+        self._close_session_log()
+        LOG.info(f"Conversation saved to: {filepath}")
+    
     def load_session(self, session_id: str) -> Optional[Dict]:
         """Load a previously saved conversation session.
         
+        A session without an end record (e.g. interrupted) loads with the
+        turns recorded so far. Sessions saved as a single JSON file by older
+        versions are still read.
+        
         Args:
             session_id: The unique identifier of the session to load
             
         Returns:
             Dictionary containing session data, or None if not found
         """
-        filename = f"{session_id}.json"
-        filepath = self.conversations_dir / filename
+        filepath = self._session_log_path(session_id)
         
         try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            if not filepath.exists():
+                legacy_path = self._legacy_session_path(session_id)
+                if legacy_path.exists():
+                    return orjson.loads(legacy_path.read_bytes())
+            
+            session_data = {}
+            turns = []
+            with open(filepath, 'rb') as f:
+                for line in f:
+                    if not line.strip():
+                        continue
+                    record = orjson.loads(line)
+                    if record.pop("record") == "turn":
+                        turns.append(record)
+                    else:
+                        session_data.update(record)
+            session_data["turns"] = turns
+            return session_data
         except Exception as e:
             LOG.error(f"Error loading conversation: {e}")
             return None
@@ -384,11 +504,18 @@ class ConversationManager:
         if not self.conversations_dir.exists():
             return []
         
-        conversations = []
-        for file in self.conversations_dir.glob("*.json"):
-            conversations.append(file.stem)
+        # One directory read; no per-file stat beyond the d_type scandir provides.
+        # Older versions saved sessions as .json, so both suffixes are listed
+        with os.scandir(self.conversations_dir) as entries:
+            conversations = {
+                os.path.splitext(entry.name)[0]
+                for entry in entries
+                if entry.name.endswith((".jsonl", ".json")) and entry.is_file(follow_symlinks=False)
+            }
         
-        return sorted(conversations, reverse=True)
+        # Session ids end in their _YYYYmmdd_HHMMSS start time, which sorts
+        # chronologically across topics without stat-ing each file
+        return sorted(conversations, key=lambda session_id: session_id[-15:], reverse=True)
     
     def generate_progress_report(self) -> str:
         """Generate a detailed progress report for the current session.
@@ -400,27 +527,27 @@ class ConversationManager:
             return "No active conversation to report on."
         
         current_score, scoring_result, coverage = self._get_scoring_data()
-        user_turns = self._get_user_turns()
         
-        report = f"""PROGRESS REPORT
+        parts = [f"""PROGRESS REPORT
             Current Score: {current_score:.1f}/100
-            Responses Given: {len(user_turns)}"""
+            Responses Given: {self.user_turn_count}"""]
         
         if scoring_result:
-            report += f"\nTopic Coverage: {coverage:.1f}%"
-            report += f"\nKeywords Mentioned: {scoring_result.keywords_found}"
+            parts.append(f"\nTopic Coverage: {coverage:.1f}%")
+            parts.append(f"\nKeywords Mentioned: {scoring_result.keywords_found}")
             
             # Add covered topics
             if scoring_result.keyword_matches:
-                report += "\n\nTopics You've Covered:"
-                for keyword, match in list(scoring_result.keyword_matches.items())[:5]:
-                    report += f"\n  • {keyword.title()}: {match.score:.1f} relevance"
+                parts.append("\n\nTopics You've Covered:")
+                parts.extend(
+                    f"\n  • {keyword.title()}: {match.score:.1f} relevance"
+                    for keyword, match in islice(scoring_result.keyword_matches.items(), 5)
+                )
             
             # Add suggestions
             suggestions = self.keyword_analyzer.generate_improvement_suggestions(scoring_result, self.current_session.topic)
             if suggestions:
-                report += "\n\nSuggestions:"
-                for suggestion in suggestions[:2]:
-                    report += f"\n  • {suggestion}"
+                parts.append("\n\nSuggestions:")
+                parts.extend(f"\n  • {suggestion}" for suggestion in suggestions[:2])
         
-        return report
\ No newline at end of file
+        return "".join(parts)
\ No newline at end of file
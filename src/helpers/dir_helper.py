@@ -1,4 +1,5 @@
-from os import path
+from pathlib import Path
+from typing import ClassVar
 
 #####################
 #    DIRECTORIES    #
@@ -8,22 +9,10 @@ from os import path
 class DirectoryHelper:
     """A class for handling directory operations for the chatbot project."""
 
-    PROJECT_DIR = path.dirname(path.dirname(path.dirname(path.abspath(__file__))))
+    PROJECT_DIR: ClassVar[Path] = Path(__file__).resolve().parent.parent.parent
     # Storage directory paths
-    STORAGE_DIR = PROJECT_DIR + "/storage"
-    LOGS_DIR = STORAGE_DIR + "/logs"
+    STORAGE_DIR: ClassVar[Path] = PROJECT_DIR / "storage"
+    LOGS_DIR: ClassVar[Path] = STORAGE_DIR / "logs"
 
     def __init__(self):
         pass
-
-
-
-
-
-
-
-
-
-
-
-
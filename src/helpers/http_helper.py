@@ -0,0 +1,66 @@
+import asyncio
+from typing import ClassVar, Optional
+from weakref import WeakKeyDictionary
+
+import httpx
+from openai import DefaultAsyncHttpxClient, DefaultHttpxClient
+
+#####################
+#    HTTP CLIENTS   #
+#####################
+
+
+class HttpHelper:
+    """Shared HTTP connection pools for every OpenAI client in the process.
+
+    LLMClient, SpeechHandler and the LangChain analyzer talk to the same API
+    host, so they reuse one sync pool instead of each opening its own
+    connections. The application owns the pool's lifetime and closes it once
+    on shutdown; individual clients never close it.
+
+    Async pools are bound to the event loop they were created on, so one is
+    kept per running loop.
+    """
+
+    # The SDK's default pool drops idle connections after 5s, which is shorter than
+    # a typical user turn, so every follow-up would pay a new TCP/TLS handshake.
+    LIMITS: ClassVar[httpx.Limits] = httpx.Limits(max_connections=20, max_keepalive_connections=8, keepalive_expiry=60.0)
+
+    _client: ClassVar[Optional[httpx.Client]] = None
+    _async_clients: ClassVar["WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]"] = WeakKeyDictionary()
+
+    @classmethod
+    def client(cls) -> httpx.Client:
+        """Shared sync HTTP client, created on first use."""
+        if cls._client is None or cls._client.is_closed:
+            cls._client = DefaultHttpxClient(limits=cls.LIMITS)
+        return cls._client
+
+    @classmethod
+    def async_client(cls) -> httpx.AsyncClient:
+        """Async HTTP client for the running event loop, created on first use.
+
+        Must be called from inside a coroutine.
+        """
+        loop = asyncio.get_running_loop()
+        client = cls._async_clients.get(loop)
+        if client is None or client.is_closed:
+            client = cls._async_clients[loop] = DefaultAsyncHttpxClient(limits=cls.LIMITS)
+        return client
+
+    @classmethod
+    def close(cls):
+        """Close the shared sync connection pool, if it was created."""
+        if cls._client is not None:
+            cls._client.close()
+            cls._client = None
+
+    @classmethod
+    async def aclose(cls):
+        """Close the running event loop's async connection pool, if it was created.
+
+        Async callers should await this before their event loop ends.
+        """
+        client = cls._async_clients.pop(asyncio.get_running_loop(), None)
+        if client is not None:
+            await client.aclose()
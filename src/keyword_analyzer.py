@@ -1,23 +1,26 @@
-from typing import Dict, List
-from dataclasses import dataclass
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Dict, List, Sequence, Tuple
+from dataclasses import dataclass, field
 from pydantic import BaseModel, Field
 from langchain_core.prompts import ChatPromptTemplate
-from langchain_core.output_parsers import PydanticOutputParser
 from langchain_openai import ChatOpenAI
 
-from config.config import Topic, Keyword
+from config.config import Topic, Keyword, find_keyword_terms
+from src.helpers.http_helper import HttpHelper
 from src.logger import LOG
 from src.utils import get_conf
 
 
-@dataclass
+@dataclass(slots=True)
 class KeywordMatch:
     """keyword match result."""
     keyword: Keyword
     found: bool
     score: float
 
-@dataclass
+@dataclass(slots=True)
 class ScoringResult:
     """scoring result."""
     total_score: float
@@ -25,34 +28,97 @@ class ScoringResult:
     keywords_found: int
     total_keywords: int
 
+@dataclass(slots=True)
+class IncrementalScoreState:
+    """Running keyword coverage of a conversation, updated one turn at a time."""
+    keyword_hits: Dict[str, int] = field(default_factory=dict)
+    max_ai_score: Dict[str, float] = field(default_factory=dict)
+    total_tokens: int = 0
+
 class KeywordAnalysis(BaseModel):
     """LangChain analysis output"""
     matched_keywords: List[str] = Field(description="List of keywords found in the text")
     relevance_scores: Dict[str, float] = Field(description="Relevance score for each keyword (0.0-1.0)")
 
+# Exact-match analysis results kept per analyzer
+ANALYSIS_CACHE_SIZE = 256
+# Texts shorter than this many words, with no keyword in them, skip AI analysis
+LLM_SKIP_WORD_THRESHOLD = 5
+
+@lru_cache(maxsize=None)
+def _join_keyword_terms(keywords: Tuple[Keyword, ...]) -> str:
+    """Comma-separated keyword terms, built once per topic keyword tuple."""
+    return ", ".join(kw.term for kw in keywords)
+
+def _skip_ai_analysis(text: str, keywords: Sequence[Keyword]) -> bool:
+    """Whether a text is too short to be worth an AI analysis call.
+    
+    Short replies such as "ok" or "yes, sure" with none of the given keywords
+    in them get an empty analysis (no matches, relevance 0.0) without an LLM
+    round-trip. Terms of other topics do not count.
+    """
+    if len(text.split()) >= LLM_SKIP_WORD_THRESHOLD:
+        return False
+    text_key = text.casefold()
+    return not any(kw.term_key in text_key for kw in keywords)
+
+def _keyword_terms_text(keywords: Sequence[Keyword]) -> str:
+    """Keyword terms for the prompt; topic keyword tuples hit the cache."""
+    if isinstance(keywords, tuple):
+        return _join_keyword_terms(keywords)
+    return ", ".join(kw.term for kw in keywords)
+
 class KeywordAnalyzer:
     """keyword analyzer with basic AI assistance."""
     
     def __init__(self):
         """Initialize the analyzer."""
-        self.llm = ChatOpenAI(model=get_conf('MODEL_NAME'), api_key=get_conf('OPENAI_API_KEY'), temperature=0)
-        self.parser = PydanticOutputParser(pydantic_object=KeywordAnalysis)
+        self.llm = ChatOpenAI(
+            model=get_conf('MODEL_NAME'),
+            api_key=get_conf('OPENAI_API_KEY'),
+            temperature=0,
+            http_client=HttpHelper.client(),
+        )
+        # Structured output through a forced tool call: the schema travels as the
+        # tool definition, so no format instructions are added to the prompt
+        self.structured_llm = self.llm.with_structured_output(KeywordAnalysis, method="function_calling")
+        # Reads and updates hold the lock, so concurrent callers can share it
+        self._analysis_cache: "OrderedDict[tuple, KeywordAnalysis]" = OrderedDict()
+        self._analysis_cache_lock = threading.Lock()
         self.setup_prompt_template()
     
     def setup_prompt_template(self):
-        """prompt for keyword analysis."""
-        template = """
-        Find these keywords in the text: {keywords}
-        
-        Text: {text}
+        """prompt for keyword analysis.
         
+        Each prompt starts with a system message that is the same on every
+        call, so the provider can reuse its cached prefix; the per-call
+        keywords and text come last.
+        """
+        system = """
+        You score how well a text discusses a list of keywords.
         For each keyword, give a score from 0.0 to 1.0 based on how well it's discussed.
+        """
+        
+        self.prompt = ChatPromptTemplate.from_messages([
+            ("system", system),
+            ("user", "Find these keywords in the text: {keywords}\n\nText: {text}"),
+        ])
+        self.chain = self.prompt | self.structured_llm
         
-        {format_instructions}
+        # Per-turn variant: earlier turns are summarized by their scores
+        delta_system = """
+        You score how well a new part of a conversation discusses a list of keywords.
+        For each keyword, give a score from 0.0 to 1.0 based on how well it's discussed.
+        Only raise a keyword above its earlier score if the new text discusses it better.
         """
         
-        self.prompt = ChatPromptTemplate.from_template(template)
-        self.chain = self.prompt | self.llm | self.parser
+        self.delta_prompt = ChatPromptTemplate.from_messages([
+            ("system", delta_system),
+            ("user", "Find these keywords in the text: {keywords}\n\n"
+                     "Scores already earned in earlier parts of the conversation: {prior_coverage}\n\n"
+                     "New text: {text}"),
+        ])
+        self.delta_chain = self.delta_prompt | self.structured_llm
     
     def check_keyword_in_text(self, text: str, keyword: str) -> bool:
         """keyword check."""
@@ -62,13 +128,13 @@ class KeywordAnalyzer:
     
     def analyze_with_langchain(self, text: str, keywords: List[Keyword]) -> KeywordAnalysis:
         """AI analysis."""
+        if _skip_ai_analysis(text, keywords):
+            return KeywordAnalysis(matched_keywords=[], relevance_scores={})
+        
         try:
-            keyword_terms = [kw.term for kw in keywords]
-            
-            result = self.chain.invoke({
+            result = self._invoke_cached(self.chain, {
                 "text": text,
-                "keywords": ", ".join(keyword_terms),
-                "format_instructions": self.parser.get_format_instructions()
+                "keywords": _keyword_terms_text(keywords)
             })
             
             return result
@@ -80,15 +146,60 @@ class KeywordAnalyzer:
                 relevance_scores={}
             )
     
+    def _invoke_cached(self, chain, inputs: Dict[str, str]) -> KeywordAnalysis:
+        """Invoke an analysis chain, reusing the result of an identical earlier call.
+        
+        Results are kept in a bounded LRU keyed on the chain and its exact
+        inputs; failed calls raise and are not cached.
+        """
+        key = (id(chain), *sorted(inputs.items()))
+        with self._analysis_cache_lock:
+            cached = self._analysis_cache.get(key)
+            if cached is not None:
+                self._analysis_cache.move_to_end(key)
+                return cached
+        
+        result = chain.invoke(inputs)
+        with self._analysis_cache_lock:
+            self._analysis_cache[key] = result
+            if len(self._analysis_cache) > ANALYSIS_CACHE_SIZE:
+                self._analysis_cache.popitem(last=False)
+        return result
+    
+    def analyze_with_langchain_delta(self, new_text: str, prior_matches: Dict[str, float], keywords: List[Keyword]) -> KeywordAnalysis:
+        """AI analysis of a new turn, given the scores of earlier turns."""
+        if _skip_ai_analysis(new_text, keywords):
+            return KeywordAnalysis(matched_keywords=[], relevance_scores={})
+        
+        try:
+            prior_coverage = ", ".join(f"{term}: {score:.1f}" for term, score in prior_matches.items()) or "none"
+            
+            return self._invoke_cached(self.delta_chain, {
+                "text": new_text,
+                "keywords": _keyword_terms_text(keywords),
+                "prior_coverage": prior_coverage
+            })
+        
+        except Exception as e:
+            LOG.error(f"AI analysis error: {e}")
+            return KeywordAnalysis(
+                matched_keywords=[],
+                relevance_scores={}
+            )
+    
     def find_keyword_matches(self, text: str, keywords: List[Keyword]) -> Dict[str, KeywordMatch]:
         """Find keyword matches using text search and AI scoring."""
         
         ai_analysis = self.analyze_with_langchain(text, keywords)
+        return self._match_keywords(text, keywords, ai_analysis)
+    
+    def _match_keywords(self, text: str, keywords: List[Keyword], ai_analysis: KeywordAnalysis) -> Dict[str, KeywordMatch]:
+        """Combine text search with a given AI analysis into keyword matches."""
         matches = {}
+        text_terms = find_keyword_terms(text)
         
         for keyword in keywords:
-            # text search
-            found = self.check_keyword_in_text(text, keyword.term)
+            found = self._keyword_in_text(keyword, text_terms)
             
             # Get AI score
             ai_score = ai_analysis.relevance_scores.get(keyword.term, 0.0)
@@ -112,12 +223,22 @@ class KeywordAnalyzer:
         
         return matches
     
+    def _keyword_in_text(self, keyword: Keyword, text_terms: set) -> bool:
+        """text search, one automaton pass for all configured terms.
+        
+        text_terms holds the casefolded terms found in the text, computed once
+        per scoring call and compared against the keyword's precomputed term_key.
+        """
+        return keyword.term_key in text_terms
+    
     def calculate_score(self, text: str, topic: Topic) -> ScoringResult:
         """scoring calculation."""
         
         matches = self.find_keyword_matches(text, topic.keywords)
-        
-
+        return self._build_scoring_result(matches, topic)
+    
+    def _build_scoring_result(self, matches: Dict[str, KeywordMatch], topic: Topic) -> ScoringResult:
+        """Total up keyword matches into a scoring result."""
         if matches:
             total_score = (sum(match.score for match in matches.values()) / len(topic.keywords)) * 100
         else:
@@ -138,11 +259,48 @@ class KeywordAnalyzer:
         full_text = ' '.join(conversation_turns)
         return self.calculate_score(full_text, topic)
     
+    def update_incremental(self, state: IncrementalScoreState, new_turn_text: str, topic: Topic) -> ScoringResult:
+        """Fold one new user turn into the running score state.
+        
+        Only the new turn is searched and sent for AI scoring; earlier turns
+        are represented by the hit counts and best AI scores kept in state.
+        """
+        ai_analysis = self.analyze_with_langchain_delta(new_turn_text, state.max_ai_score, topic.keywords)
+        text_terms = find_keyword_terms(new_turn_text)
+        
+        for keyword in topic.keywords:
+            term = keyword.term
+            if self._keyword_in_text(keyword, text_terms) or term in ai_analysis.matched_keywords:
+                state.keyword_hits[term] = state.keyword_hits.get(term, 0) + 1
+            
+            ai_score = ai_analysis.relevance_scores.get(term)
+            if ai_score is not None:
+                state.max_ai_score[term] = max(ai_score, state.max_ai_score.get(term, ai_score))
+        
+        state.total_tokens += len(new_turn_text.split())
+        return self.score_from_state(state, topic)
+    
+    def score_from_state(self, state: IncrementalScoreState, topic: Topic) -> ScoringResult:
+        """Build a scoring result from the running score state without rescanning."""
+        matches = {}
+        
+        for keyword in topic.keywords:
+            found = state.keyword_hits.get(keyword.term, 0) > 0
+            ai_score = state.max_ai_score.get(keyword.term, 0.0)
+            score = max(0.0, ai_score) if found else ai_score
+            
+            if found or score > 0.1:
+                matches[keyword.term] = KeywordMatch(
+                    keyword=keyword,
+                    found=found,
+                    score=score
+                )
+        
+        return self._build_scoring_result(matches, topic)
+    
     def get_missing_keywords(self, scoring_result: ScoringResult, topic: Topic) -> List[str]:
         """Get keywords not found."""
-        found_terms = set(scoring_result.keyword_matches.keys())
-        all_terms = {kw.term for kw in topic.keywords}
-        return list(all_terms - found_terms)
+        return list(topic.terms - scoring_result.keyword_matches.keys())
     
     def generate_improvement_suggestions(self, scoring_result: ScoringResult, topic: Topic) -> List[str]:
         """suggestions."""
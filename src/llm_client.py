@@ -1,23 +1,206 @@
-from openai import OpenAI
-from typing import List, Dict, Optional
-from dataclasses import dataclass
-from config.config import Topic
+import asyncio
+import threading
+import time
+from collections import OrderedDict, deque
+from itertools import islice
+import orjson
+from openai import NOT_GIVEN, AsyncOpenAI, OpenAI
+from typing import AsyncIterator, Deque, Iterator, List, Dict, NamedTuple, Optional, Tuple
+from dataclasses import dataclass, replace
+from functools import lru_cache
+from weakref import WeakKeyDictionary
+from config.config import Keyword, Topic
+from src.helpers.http_helper import HttpHelper
 from src.logger import LOG
-from src.utils import get_conf
+from src.utils import get_conf, get_conf_typed
 
+# Messages kept in the conversation history; older ones are dropped
+MAX_HISTORY = 200
+# Recent messages kept ready in API format for get_conversation_context
+CONTEXT_WINDOW = 10
+# Async API calls allowed in flight at once per client
+MAX_CONCURRENCY = 16
+# Completed responses kept for reuse by identical requests; only requests
+# sampled at temperature 0 are cached, others should vary between calls
+RESPONSE_CACHE_SIZE = 128
+# SDK retries (exponential backoff, honouring Retry-After) for 429s and transient errors
+MAX_RETRIES = 5
+# Used when a follow-up question could not be generated
+FALLBACK_FOLLOW_UP_QUESTION = "That's interesting! Can you tell me more about what you think influences this the most?"
 
-@dataclass
-class ConversationMessage:
+# Static instructions for batched follow-up generation, shared by every call
+_BATCH_FOLLOW_UP_INSTRUCTIONS = """
+You are a curious friend having several separate conversations, each about its own topic.
+
+For each numbered item, generate a natural follow-up question that:
+1. Acknowledges what the user said
+2. Encourages them to elaborate on key areas they haven't fully covered
+3. Sounds conversational and engaging
+
+Keep each question under 50 words.
+
+Reply with a JSON object of the form {"questions": ["...", "..."]} containing exactly one question per item, in the same order.
+"""
+
+# Per-topic prompt templates, filled once per topic by _topic_prompt
+_FOLLOW_UP_INSTRUCTIONS_TEMPLATE = """
+You are having a conversation about {topic_name}.
+
+Key areas that should be covered in this topic:
+{key_areas}
+
+Each message tells you the current conversation score based on keyword coverage and what the user just said.
+
+Generate a natural follow-up question that:
+1. Acknowledges what the user said
+2. Encourages them to elaborate on areas they haven't fully covered
+3. Sounds conversational and engaging
+4. Helps guide them toward the key concepts if they're missing them
+
+Keep it under 50 words and make it sound like a curious friend asking for more details.
+"""
+
+# Topic-independent persona first, so every session shares the prompt prefix
+_ROLEPLAY_PROMPT_TEMPLATE = """
+You are an enthusiastic and knowledgeable conversation partner.
+
+Your personality traits:
+- Curious and engaging
+- Knowledgeable but not condescending  
+- Asks thoughtful follow-up questions
+- Shares interesting insights when appropriate
+- Encourages the user to share their thoughts and experiences
+
+Your goal is to have a natural, engaging conversation while gently guiding the discussion to cover the key areas below. You should respond conversationally and show genuine interest in what the user says.
+
+Always:
+- Keep responses under 100 words
+- Ask one follow-up question per response
+- Acknowledge what the user said before asking more
+- Be encouraging and positive
+
+You love discussing {topic_name}.
+
+Topic focus: {topic_description}
+
+Key areas you're interested in discussing:
+{key_areas}
+"""
+
+# Per-turn part of the follow-up prompt
+_FOLLOW_UP_PROMPT_TEMPLATE = (
+    "Current conversation score based on keyword coverage: {current_score:.1f}/100\n"
+    'The user just said: "{user_response}"'
+)
+
+@dataclass(frozen=True)
+class LLMConfig:
+    """Chat completion settings, read from the configuration once.
+    
+    Attributes:
+        model: Model name to use
+        temperature: Sampling temperature for regular responses
+        max_tokens: Maximum response length for regular responses
+        top_p: Nucleus sampling parameter
+        follow_up_temperature: Sampling temperature for follow-up questions
+        follow_up_max_tokens: Maximum length of follow-up questions
+    """
+    model: str
+    temperature: float = 0.7
+    max_tokens: int = 500
+    top_p: float = 1
+    follow_up_temperature: float = 0.8
+    follow_up_max_tokens: int = 150
+    
+    @classmethod
+    def from_conf(cls) -> "LLMConfig":
+        """Build the settings from the configured environment values."""
+        return cls(
+            model=get_conf('MODEL_NAME'),
+            temperature=get_conf_typed('TEMPERATURE', 0.7, float),
+            max_tokens=get_conf_typed('MAX_TOKENS', 500, int),
+            top_p=get_conf_typed('TOP_P', 1, int),
+            follow_up_temperature=get_conf_typed('FOLLOW_UP_Q_TEP', 0.8, float),
+            follow_up_max_tokens=get_conf_typed('FOLLOW_UP_Q_MAX_TOKENS', 150, int),
+        )
+
+@lru_cache(maxsize=None)
+def _key_areas(keywords: Tuple[Keyword, ...], limit: int) -> str:
+    """Bulleted "term: description" lines for a topic's first keywords, built once per topic."""
+    return "\n".join(f"- {kw.term}: {kw.description}" for kw in keywords[:limit])
+
+@lru_cache(maxsize=None)
+def _topic_prompt(template: str, topic: Topic, key_area_limit: int) -> str:
+    """Fill a per-topic prompt template; each (template, topic) pair is rendered once."""
+    return template.format_map({
+        "topic_name": topic.name,
+        "topic_description": topic.description,
+        "key_areas": _key_areas(topic.keywords, key_area_limit),
+    })
+
+class _RateLimiter:
+    """Client-side token buckets for the API's requests- and tokens-per-minute limits.
+    
+    Each call reserves one request and its estimated tokens. When a bucket is
+    overdrawn the caller waits until it has refilled, so bursts are smoothed
+    before they reach the API instead of coming back as 429 errors.
+    """
+    def __init__(self, requests_per_minute: int, tokens_per_minute: int):
+        self._capacity = (float(requests_per_minute), float(tokens_per_minute))
+        self._levels = list(self._capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def _reserve(self, tokens: int) -> float:
+        """Take one request and the given tokens; return the seconds to wait before sending."""
+        with self._lock:
+            now = time.monotonic()
+            elapsed, self._updated = now - self._updated, now
+            wait = 0.0
+            for i, (capacity, cost) in enumerate(zip(self._capacity, (1, min(tokens, self._capacity[1])))):
+                refill_per_second = capacity / 60.0
+                self._levels[i] = min(capacity, self._levels[i] + elapsed * refill_per_second) - cost
+                wait = max(wait, -self._levels[i] / refill_per_second)
+            return wait
+    
+    def acquire(self, tokens: int):
+        """Block until the request fits within the configured limits."""
+        wait = self._reserve(tokens)
+        if wait > 0:
+            LOG.debug(f"Rate limiter: waiting {wait:.2f}s before API call")
+            time.sleep(wait)
+    
+    async def aacquire(self, tokens: int):
+        """Async variant of acquire."""
+        wait = self._reserve(tokens)
+        if wait > 0:
+            LOG.debug(f"Rate limiter: waiting {wait:.2f}s before API call")
+            await asyncio.sleep(wait)
+
+@lru_cache(maxsize=1)
+def _rate_limiter() -> _RateLimiter:
+    """Process-wide limiter; the API limits apply per key, not per client."""
+    return _RateLimiter(get_conf_typed('OPENAI_RPM', 500, int), get_conf_typed('OPENAI_TPM', 200000, int))
+
+@lru_cache(maxsize=1)
+def _default_config() -> LLMConfig:
+    """Configured LLM settings, loaded on first use and shared by all clients."""
+    return LLMConfig.from_conf()
+
+class ConversationMessage(NamedTuple):
     """Represents a single message in a conversation.
     
+    A named tuple, so each history entry is a single compact tuple object
+    that is cheap to create while keeping attribute access.
+    
     Attributes:
         role: The message sender ("user", "assistant", or "system")
         content: The actual message text
-        timestamp: Optional timestamp for when the message was created
+        timestamp: When the message was created (Unix time, 0.0 if not recorded)
     """
     role: str
     content: str
-    timestamp: float = None
+    timestamp: float = 0.0
 
 class LLMClient:
     """Client for interacting with OpenAI's language models.
@@ -26,55 +209,243 @@ class LLMClient:
     conversation history, generating responses, and creating specialized prompts
     for different conversation scenarios.
     """
-    def __init__(self, api_key: str, model: str = get_conf("MODEL_NAME")):
+    def __init__(self, api_key: str, model: Optional[str] = None, config: Optional[LLMConfig] = None):
         """Initialize the LLM client.
         
         Args:
             api_key: OpenAI API key for authentication
-            model: Model name to use (defaults to configured MODEL_NAME)
+            model: Model name to use (defaults to the configured model)
+            config: Completion settings (defaults to the configured values)
         """
-        self.client = OpenAI(api_key=api_key)
-        self.model = model
-        self.conversation_history: List[ConversationMessage] = []
+        self.client = OpenAI(api_key=api_key, http_client=HttpHelper.client(), max_retries=MAX_RETRIES)
+        self._api_key = api_key
+        # Async client and concurrency limit per event loop; both are bound to
+        # the loop they were created on
+        self._loop_state: "WeakKeyDictionary[asyncio.AbstractEventLoop, Tuple[AsyncOpenAI, asyncio.Semaphore]]" = WeakKeyDictionary()
+        self.conversation_history: Deque[ConversationMessage] = deque(maxlen=MAX_HISTORY)
+        # API-format dicts of the latest messages, built once per message
+        self._context_messages: Deque[Dict[str, str]] = deque(maxlen=CONTEXT_WINDOW)
         self.system_prompt = ""
+        self._system_message: Optional[Dict[str, str]] = None
+        # Shared by the sync, async and streaming paths, so access holds the lock
+        self._response_cache: "OrderedDict[tuple, str]" = OrderedDict()
+        self._response_cache_lock = threading.Lock()
+        self._rate_limiter = _rate_limiter()
         
-        # Load configuration once during initialization
-        self._load_config()
+        self.config = config or _default_config()
+        if model:
+            self.config = replace(self.config, model=model)
+        self.model = self.config.model
+        # Settings used for follow-up questions, derived once
+        self._follow_up_config = replace(
+            self.config,
+            temperature=self.config.follow_up_temperature,
+            max_tokens=self.config.follow_up_max_tokens,
+        )
     
-    def _load_config(self):
-        """Load all configuration values once during initialization."""
-        self.temperature = float(get_conf('TEMPERATURE', 0.7))
-        self.max_tokens = int(get_conf('MAX_TOKENS', 500))
-        self.top_p = int(get_conf('TOP_P', 1))
-        self.follow_up_temperature = float(get_conf('FOLLOW_UP_Q_TEP'))
-        self.follow_up_max_tokens = int(get_conf('FOLLOW_UP_Q_MAX_TOKENS'))
-    
-    def _make_api_call(self, messages: List[Dict], temperature: float = None, max_tokens: int = None) -> Optional[str]:
+    def _make_api_call(self, messages: List[Dict], config: Optional[LLMConfig] = None, response_format: Optional[Dict] = None) -> Optional[str]:
         """Make a chat completion API call with error handling.
         
         Args:
             messages: List of message dictionaries for the API
-            temperature: Optional temperature override
-            max_tokens: Optional max_tokens override
+            config: Optional settings override (defaults to the client's config)
+            response_format: Optional response format, e.g. {"type": "json_object"}
             
         Returns:
             API response content or None if error occurred
         """
+        config = config or self.config
+        key = self._response_cache_key(messages, config)
+        cached = self._get_cached_response(key)
+        if cached is not None:
+            return cached
+        
         try:
+            self._rate_limiter.acquire(self._estimate_tokens(messages, config))
             response = self.client.chat.completions.create(
-                model=self.model,
-                messages=messages,
-                temperature=temperature or self.temperature,
-                max_tokens=max_tokens or self.max_tokens,
-                top_p=self.top_p,
-                frequency_penalty=0,
-                presence_penalty=0
+                **self._completion_kwargs(config, messages=messages, response_format=response_format or NOT_GIVEN)
             )
-            return response.choices[0].message.content.strip()
+            return self._store_response(key, response.choices[0].message.content.strip())
         except Exception as e:
             LOG.error(f"Error making API call: {e}")
             return None
     
+    @staticmethod
+    def _completion_kwargs(config: LLMConfig, **extra) -> Dict:
+        """Keyword arguments for chat.completions.create, shared by every call path.
+        
+        Args:
+            config: Settings to send
+            **extra: Request-specific arguments, e.g. messages, stream or n
+            
+        Returns:
+            Dictionary of arguments for the API call
+        """
+        return {
+            "model": config.model,
+            "temperature": config.temperature,
+            "max_tokens": config.max_tokens,
+            "top_p": config.top_p,
+            "frequency_penalty": 0,
+            "presence_penalty": 0,
+            **extra,
+        }
+    
+    @staticmethod
+    def _estimate_tokens(messages: List[Dict], config: LLMConfig, completions: int = 1) -> int:
+        """Rough token cost of a request: ~4 characters per prompt token plus the completion budget."""
+        return sum(len(message["content"]) for message in messages) // 4 + config.max_tokens * completions
+    
+    @staticmethod
+    def _response_cache_key(messages: List[Dict], config: LLMConfig) -> Optional[tuple]:
+        """Key identifying a request by its settings and exact messages.
+        
+        Returns:
+            The cache key, or None if the request is sampled (temperature
+            above 0) and its response must not be reused
+        """
+        if config.temperature != 0:
+            return None
+        return (config, *((message["role"], message["content"]) for message in messages))
+    
+    def _get_cached_response(self, key: Optional[tuple]) -> Optional[str]:
+        """Return the response of an identical earlier request, if still cached."""
+        if key is None:
+            return None
+        with self._response_cache_lock:
+            cached = self._response_cache.get(key)
+            if cached is not None:
+                self._response_cache.move_to_end(key)
+            return cached
+    
+    def _store_response(self, key: Optional[tuple], content: str) -> str:
+        """Cache a completed response, evicting the least recently used one."""
+        if content and key is not None:
+            with self._response_cache_lock:
+                self._response_cache[key] = content
+                if len(self._response_cache) > RESPONSE_CACHE_SIZE:
+                    self._response_cache.popitem(last=False)
+        return content
+    
+    def _async_state(self) -> Tuple[AsyncOpenAI, asyncio.Semaphore]:
+        """Async client and semaphore for the running event loop, created on first use."""
+        loop = asyncio.get_running_loop()
+        state = self._loop_state.get(loop)
+        if state is None or state[0].is_closed():
+            client = AsyncOpenAI(api_key=self._api_key, http_client=HttpHelper.async_client(), max_retries=MAX_RETRIES)
+            state = self._loop_state[loop] = (client, asyncio.Semaphore(MAX_CONCURRENCY))
+        return state
+    
+    @property
+    def async_client(self) -> AsyncOpenAI:
+        """Async OpenAI client for the running event loop."""
+        return self._async_state()[0]
+    
+    @property
+    def api_semaphore(self) -> asyncio.Semaphore:
+        """Bounds concurrent async API calls, so a large gather does not hit rate limits."""
+        return self._async_state()[1]
+    
+    async def _amake_api_call(self, messages: List[Dict], config: Optional[LLMConfig] = None) -> Optional[str]:
+        """Async variant of _make_api_call, so independent calls can run concurrently.
+        
+        Args:
+            messages: List of message dictionaries for the API
+            config: Optional settings override (defaults to the client's config)
+            
+        Returns:
+            API response content or None if error occurred
+        """
+        config = config or self.config
+        key = self._response_cache_key(messages, config)
+        cached = self._get_cached_response(key)
+        if cached is not None:
+            return cached
+        
+        try:
+            async with self.api_semaphore:
+                await self._rate_limiter.aacquire(self._estimate_tokens(messages, config))
+                response = await self.async_client.chat.completions.create(
+                    **self._completion_kwargs(config, messages=messages)
+                )
+            return self._store_response(key, response.choices[0].message.content.strip())
+        except Exception as e:
+            LOG.error(f"Error making API call: {e}")
+            return None
+    
+    def _stream_api_call(self, messages: List[Dict], config: Optional[LLMConfig] = None) -> Iterator[str]:
+        """Make a streaming chat completion API call with error handling.
+        
+        Args:
+            messages: List of message dictionaries for the API
+            config: Optional settings override (defaults to the client's config)
+            
+        Yields:
+            Text deltas as they arrive
+            
+        Raises:
+            Exception: The API error, after logging it; deltas already yielded
+                are then only part of the response
+        """
+        config = config or self.config
+        key = self._response_cache_key(messages, config)
+        cached = self._get_cached_response(key)
+        if cached is not None:
+            yield cached
+            return
+        
+        parts = []
+        try:
+            self._rate_limiter.acquire(self._estimate_tokens(messages, config))
+            stream = self.client.chat.completions.create(
+                **self._completion_kwargs(config, messages=messages, stream=True)
+            )
+            for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    parts.append(chunk.choices[0].delta.content)
+                    yield parts[-1]
+            self._store_response(key, "".join(parts).strip())
+        except Exception as e:
+            LOG.error(f"Error making streaming API call: {e}")
+            raise
+    
+    async def _astream_api_call(self, messages: List[Dict], config: Optional[LLMConfig] = None) -> AsyncIterator[str]:
+        """Async variant of _stream_api_call.
+        
+        Args:
+            messages: List of message dictionaries for the API
+            config: Optional settings override (defaults to the client's config)
+            
+        Yields:
+            Text deltas as they arrive
+            
+        Raises:
+            Exception: The API error, after logging it; deltas already yielded
+                are then only part of the response
+        """
+        config = config or self.config
+        key = self._response_cache_key(messages, config)
+        cached = self._get_cached_response(key)
+        if cached is not None:
+            yield cached
+            return
+        
+        parts = []
+        try:
+            async with self.api_semaphore:
+                await self._rate_limiter.aacquire(self._estimate_tokens(messages, config))
+                stream = await self.async_client.chat.completions.create(
+                    **self._completion_kwargs(config, messages=messages, stream=True)
+                )
+                async for chunk in stream:
+                    if chunk.choices and chunk.choices[0].delta.content:
+                        parts.append(chunk.choices[0].delta.content)
+                        yield parts[-1]
+            self._store_response(key, "".join(parts).strip())
+        except Exception as e:
+            LOG.error(f"Error making streaming API call: {e}")
+            raise
+    
     def set_system_prompt(self, prompt: str):
         """Set the system prompt for the conversation.
         
@@ -82,6 +453,7 @@ class LLMClient:
             prompt: System prompt that defines the AI's behavior
         """
         self.system_prompt = prompt
+        self._system_message = {"role": "system", "content": prompt} if prompt else None
     
     def add_message(self, role: str, content: str):
         """Add a message to the conversation history.
@@ -90,57 +462,57 @@ class LLMClient:
             role: Message role ("user", "assistant", or "system")
             content: The message content
         """
-        message = ConversationMessage(role=role, content=content)
-        self.conversation_history.append(message)
+        self.conversation_history.append(ConversationMessage(role, content))
+        self._context_messages.append({"role": role, "content": content})
     
     def clear_history(self):
         """Clear all conversation history."""
-        self.conversation_history = []
+        self.conversation_history.clear()
+        self._context_messages.clear()
     
-    def get_conversation_context(self, max_messages: int = 10) -> List[Dict[str, str]]:
+    def get_conversation_context(self, max_messages: int = CONTEXT_WINDOW) -> List[Dict[str, str]]:
         """Get conversation context formatted for OpenAI API.
         
+        Windows up to CONTEXT_WINDOW messages reuse the prebuilt message
+        dicts; larger windows convert from the full history.
+        
         Args:
             max_messages: Maximum number of recent messages to include
             
         Returns:
             List of message dictionaries formatted for OpenAI API
         """
-        messages = []
-        
         # Add system prompt if set
-        if self.system_prompt:
-            messages.append({"role": "system", "content": self.system_prompt})
+        messages = [self._system_message] if self._system_message else []
         
-        # Get recent conversation history
-        recent_messages = self._get_recent_messages(max_messages)
-        
-        # Convert to API format
-        for msg in recent_messages:
-            messages.append({"role": msg.role, "content": msg.content})
+        if max_messages <= CONTEXT_WINDOW:
+            skip = max(0, len(self._context_messages) - max_messages)
+            messages.extend(islice(self._context_messages, skip, None))
+        else:
+            # Convert recent conversation history to API format
+            messages.extend({"role": role, "content": content} for role, content, _ in self._get_recent_messages(max_messages))
         
         return messages
     
-    def _get_recent_messages(self, max_messages: int) -> List[ConversationMessage]:
+    def _get_recent_messages(self, max_messages: int) -> Iterator[ConversationMessage]:
         """Get the most recent conversation messages.
         
         Args:
             max_messages: Maximum number of messages to return
             
         Returns:
-            List of recent conversation messages
+            Iterator over the recent conversation messages, oldest first
         """
-        if len(self.conversation_history) <= max_messages:
-            return self.conversation_history
-        return self.conversation_history[-max_messages:]
+        skip = max(0, len(self.conversation_history) - max_messages)
+        return islice(self.conversation_history, skip, None)
     
-    def generate_response(self, user_input: str, temperature: float = None, max_tokens: int = None) -> Optional[str]:
+    def generate_response(self, user_input: str, config: Optional[LLMConfig] = None) -> Optional[str]:
         """Generate an AI response to user input.
         
         Args:
             user_input: The user's message
-            temperature: Creativity level (0.0-2.0, higher = more creative)
-            max_tokens: Maximum response length
+            config: Optional settings override, e.g. a different temperature
+                or max_tokens (defaults to the client's config)
             
         Returns:
             AI-generated response string, or None if error occurred
@@ -148,12 +520,84 @@ class LLMClient:
         self.add_message("user", user_input)
         messages = self.get_conversation_context()
         
-        assistant_response = self._make_api_call(messages, temperature, max_tokens)
+        assistant_response = self._make_api_call(messages, config)
         if assistant_response:
             self.add_message("assistant", assistant_response)
             
         return assistant_response
     
+    async def agenerate_response(self, user_input: str, config: Optional[LLMConfig] = None) -> Optional[str]:
+        """Async variant of generate_response.
+        
+        Args:
+            user_input: The user's message
+            config: Optional settings override (defaults to the client's config)
+            
+        Returns:
+            AI-generated response string, or None if error occurred
+        """
+        self.add_message("user", user_input)
+        messages = self.get_conversation_context()
+        
+        assistant_response = await self._amake_api_call(messages, config)
+        if assistant_response:
+            self.add_message("assistant", assistant_response)
+            
+        return assistant_response
+    
+    def generate_response_stream(self, user_input: str, config: Optional[LLMConfig] = None) -> Iterator[str]:
+        """Stream an AI response to user input as it is generated.
+        
+        The complete response is added to the conversation history once the
+        stream ends.
+        
+        Args:
+            user_input: The user's message
+            config: Optional settings override (defaults to the client's config)
+            
+        Yields:
+            Text deltas of the response
+            
+        Raises:
+            Exception: If the API call fails; the partial response is not
+                added to the history
+        """
+        self.add_message("user", user_input)
+        messages = self.get_conversation_context()
+        
+        parts = []
+        for delta in self._stream_api_call(messages, config):
+            parts.append(delta)
+            yield delta
+        
+        if parts:
+            self.add_message("assistant", "".join(parts).strip())
+    
+    async def agenerate_response_stream(self, user_input: str, config: Optional[LLMConfig] = None) -> AsyncIterator[str]:
+        """Async variant of generate_response_stream.
+        
+        Args:
+            user_input: The user's message
+            config: Optional settings override (defaults to the client's config)
+            
+        Yields:
+            Text deltas of the response
+            
+        Raises:
+            Exception: If the API call fails; the partial response is not
+                added to the history
+        """
+        self.add_message("user", user_input)
+        messages = self.get_conversation_context()
+        
+        parts = []
+        async for delta in self._astream_api_call(messages, config):
+            parts.append(delta)
+            yield delta
+        
+        if parts:
+            self.add_message("assistant", "".join(parts).strip())
+    
     def generate_follow_up_question(self, topic: Topic, user_response: str, current_score: float) -> str:
         """Generate a contextual follow-up question based on conversation progress.
         
@@ -168,15 +612,136 @@ class LLMClient:
         Returns:
             Generated follow-up question string
         """
-        prompt = self._build_follow_up_prompt(topic, user_response, current_score)
-        messages = [{"role": "user", "content": prompt}]
+        messages = self._build_follow_up_messages(topic, user_response, current_score)
+        
+        response = self._make_api_call(messages, self._follow_up_config)
+        
+        return response or FALLBACK_FOLLOW_UP_QUESTION
+    
+    async def agenerate_follow_up_question(self, topic: Topic, user_response: str, current_score: float) -> str:
+        """Async variant of generate_follow_up_question.
+        
+        Args:
+            topic: The conversation topic with keywords and descriptions
+            user_response: The user's most recent message
+            current_score: Current conversation score (0-100)
+            
+        Returns:
+            Generated follow-up question string
+        """
+        messages = self._build_follow_up_messages(topic, user_response, current_score)
+        
+        response = await self._amake_api_call(messages, self._follow_up_config)
+        
+        return response or FALLBACK_FOLLOW_UP_QUESTION
+    
+    def generate_follow_up_drafts(self, topic: Topic, user_response: str, current_score: float, count: int = 3) -> List[str]:
+        """Generate several alternative follow-up questions in one API call.
+        
+        Uses the same prompt as generate_follow_up_question and asks the API
+        for ``count`` completions, e.g. so a caller can rank candidates.
+        
+        Args:
+            topic: The conversation topic with keywords and descriptions
+            user_response: The user's most recent message
+            current_score: Current conversation score (0-100)
+            count: Number of alternative questions to generate
+            
+        Returns:
+            List of generated questions (the fallback question if the call failed)
+        """
+        messages = self._build_follow_up_messages(topic, user_response, current_score)
+        config = self._follow_up_config
+        
+        try:
+            self._rate_limiter.acquire(self._estimate_tokens(messages, config, count))
+            response = self.client.chat.completions.create(
+                **self._completion_kwargs(config, messages=messages, n=count)
+            )
+            drafts = [choice.message.content.strip() for choice in response.choices if choice.message.content]
+        except Exception as e:
+            LOG.error(f"Error making API call: {e}")
+            drafts = []
+        
+        return drafts or [FALLBACK_FOLLOW_UP_QUESTION]
+    
+    def generate_follow_up_questions_batch(self, items: List[Tuple[Topic, str, float]]) -> List[str]:
+        """Generate follow-up questions for several conversations in one API call.
+        
+        Args:
+            items: (topic, user_response, current_score) for each conversation
+            
+        Returns:
+            One follow-up question per item, in order; items without a usable
+            answer get the fallback question
+        """
+        if not items:
+            return []
+        
+        messages = [
+            {"role": "system", "content": _BATCH_FOLLOW_UP_INSTRUCTIONS},
+            {"role": "user", "content": self._build_follow_up_batch_prompt(items)},
+        ]
+        config = replace(self._follow_up_config, max_tokens=self._follow_up_config.max_tokens * len(items))
+        
+        questions = []
+        response = self._make_api_call(messages, config, response_format={"type": "json_object"})
+        if response:
+            try:
+                questions = [str(q).strip() for q in orjson.loads(response).get("questions", [])]
+            except (orjson.JSONDecodeError, AttributeError, TypeError) as e:
+                LOG.error(f"Error parsing batched follow-up questions: {e}")
+        
+        if len(questions) != len(items):
+            LOG.warning(f"Batched follow-up generation returned {len(questions)} questions for {len(items)} items")
+        return [questions[i] if i < len(questions) and questions[i] else FALLBACK_FOLLOW_UP_QUESTION for i in range(len(items))]
+    
+    @staticmethod
+    def _build_follow_up_batch_prompt(items: List[Tuple[Topic, str, float]]) -> str:
+        """Build the numbered item list for batched follow-up generation.
+        
+        Args:
+            items: (topic, user_response, current_score) for each conversation
+            
+        Returns:
+            Prompt string with one numbered entry per item
+        """
+        return "\n\n".join(
+            f"[{i}] Topic: {topic.name}\n"
+            f"Key areas: {', '.join(kw.term for kw in topic.keywords)}\n"
+            f"Current conversation score based on keyword coverage: {current_score:.1f}/100\n"
+            f'The user just said: "{user_response}"'
+            for i, (topic, user_response, current_score) in enumerate(items, 1)
+        )
+    
+    def stream_follow_up_question(self, topic: Topic, user_response: str, current_score: float) -> Iterator[str]:
+        """Stream a contextual follow-up question as it is generated.
         
-        response = self._make_api_call(messages, self.follow_up_temperature, self.follow_up_max_tokens)
+        Same prompt as generate_follow_up_question, but yields text deltas so
+        callers can start delivering the reply before the completion ends.
+        
+        Args:
+            topic: The conversation topic with keywords and descriptions
+            user_response: The user's most recent message
+            current_score: Current conversation score (0-100)
+            
+        Yields:
+            Text deltas of the follow-up question
+            
+        Raises:
+            Exception: If the API call fails; deltas already yielded are then
+                only part of the question
+        """
+        messages = self._build_follow_up_messages(topic, user_response, current_score)
         
-        return response or "That's interesting! Can you tell me more about what you think influences this the most?"
+        yield from self._stream_api_call(messages, self._follow_up_config)
     
-    def _build_follow_up_prompt(self, topic: Topic, user_response: str, current_score: float) -> str:
-        """Build the prompt for generating follow-up questions.
+    def _build_follow_up_messages(self, topic: Topic, user_response: str, current_score: float) -> List[Dict[str, str]]:
+        """Build the messages for generating follow-up questions.
+        
+        The topic instructions come first and are identical for every turn of a
+        session, so the provider can reuse its cached prompt prefix; only the
+        final user message changes per turn.
         
         Args:
             topic: The conversation topic
@@ -184,26 +749,35 @@ class LLMClient:
             current_score: Current conversation score
             
         Returns:
-            Complete prompt string for follow-up question generation
+            List of message dictionaries for the API
         """
-        key_areas = chr(10).join([f"- {kw.term}: {kw.description}" for kw in topic.keywords[:8]])
+        return [
+            {"role": "system", "content": self._build_follow_up_instructions(topic)},
+            {"role": "user", "content": self._build_follow_up_prompt(user_response, current_score)},
+        ]
+    
+    def _build_follow_up_instructions(self, topic: Topic) -> str:
+        """Build the static, per-topic instructions for follow-up questions.
         
-        return f"""
-You are having a conversation about {topic.name}. The user just said: "{user_response}"
-
-Current conversation score based on keyword coverage: {current_score:.1f}/100
-
-Key areas that should be covered in this topic:
-{key_areas}
-
-Generate a natural follow-up question that:
-1. Acknowledges what the user said
-2. Encourages them to elaborate on areas they haven't fully covered
-3. Sounds conversational and engaging
-4. Helps guide them toward the key concepts if they're missing them
-
-Keep it under 50 words and make it sound like a curious friend asking for more details.
-"""
+        Args:
+            topic: The conversation topic
+            
+        Returns:
+            Instruction string that does not depend on the current turn
+        """
+        return _topic_prompt(_FOLLOW_UP_INSTRUCTIONS_TEMPLATE, topic, 8)
+    
+    def _build_follow_up_prompt(self, user_response: str, current_score: float) -> str:
+        """Build the per-turn part of the follow-up question prompt.
+        
+        Args:
+            user_response: User's recent message
+            current_score: Current conversation score
+            
+        Returns:
+            Prompt string with the turn-specific details
+        """
+        return _FOLLOW_UP_PROMPT_TEMPLATE.format_map({"current_score": current_score, "user_response": user_response})
     
     def create_roleplay_persona(self, topic: Topic) -> str:
         """Create a system prompt for topic-specific roleplay conversations.
@@ -228,31 +802,7 @@ Keep it under 50 words and make it sound like a curious friend asking for more d
         Returns:
             Complete roleplay system prompt
         """
-        key_areas = chr(10).join([f"- {kw.term}: {kw.description}" for kw in topic.keywords[:6]])
-        
-        return f"""
-You are an enthusiastic and knowledgeable conversation partner who loves discussing {topic.name}.
-
-Your personality traits:
-- Curious and engaging
-- Knowledgeable but not condescending  
-- Asks thoughtful follow-up questions
-- Shares interesting insights when appropriate
-- Encourages the user to share their thoughts and experiences
-
-Topic focus: {topic.description}
-
-Key areas you're interested in discussing:
-{key_areas}
-
-Your goal is to have a natural, engaging conversation while gently guiding the discussion to cover these key areas. You should respond conversationally and show genuine interest in what the user says.
-
-Always:
-- Keep responses under 100 words
-- Ask one follow-up question per response
-- Acknowledge what the user said before asking more
-- Be encouraging and positive
-"""
+        return _topic_prompt(_ROLEPLAY_PROMPT_TEMPLATE, topic, 6)
     
     def test_connection(self) -> bool:
         """Test the connection to OpenAI API.
@@ -263,6 +813,6 @@ Always:
             True if connection successful, False otherwise
         """
         test_messages = [{"role": "user", "content": "Hello, this is a test. Please respond with 'Connection successful'."}]
-        result = self._make_api_call(test_messages, max_tokens=10)
+        result = self._make_api_call(test_messages, replace(self.config, max_tokens=10))
         
         return result is not None and "successful" in result.lower()
\ No newline at end of file
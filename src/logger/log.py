@@ -33,34 +33,24 @@ class LOG:
 
     # Configure the logger to write logs to the specified file
     # logger.remove()  # Remove any previously added sinks
-    if os.environ.get("PROJECT_ENV") != "prod":
+    # LOG_TO_FILE=0 turns the file sink off (e.g. for short-lived scripts); with
+    # delay=True the log directory and file are only created by the first record
+    if os.environ.get("PROJECT_ENV") != "prod" and os.environ.get("LOG_TO_FILE", "1") == "1":
         logger.add(
-            DirectoryHelper.LOGS_DIR + "/logs.log", rotation="100 MB", retention="356 days", level=lvl
+            DirectoryHelper.LOGS_DIR / "logs.log", rotation="100 MB", retention="356 days", level=lvl, delay=True
         )
     _custom_name = None
 
     def __init__(self, name):
         LOG._custom_name = name
 
-    @classmethod
-    def error(cls, message):
-        logger.error(message)
-
-    @classmethod
-    def warning(cls, message):
-        logger.warning(message)
-
-    @classmethod
-    def info(cls, message):
-        logger.info(message)
-
-    @classmethod
-    def debug(cls, message):
-        logger.debug(message)
-
-    @classmethod
-    def exception(cls, message):
-        logger.exception(message)
+    # Bound straight to loguru, so each call skips a forwarding frame and the
+    # record's location is the caller rather than this module
+    error = staticmethod(logger.error)
+    warning = staticmethod(logger.warning)
+    info = staticmethod(logger.info)
+    debug = staticmethod(logger.debug)
+    exception = staticmethod(logger.exception)
 
 
 # Usage:
@@ -1,13 +1,14 @@
 import threading
 import time
+from array import array
 from typing import Optional
-import os
+import io
 from openai import OpenAI
-import tempfile
 import pygame
 import pyaudio
 import wave
 
+from src.helpers.http_helper import HttpHelper
 from src.logger import LOG
 from src.utils import get_conf
 
@@ -20,7 +21,8 @@ class SpeechHandler:
     """
     def __init__(self):
         """Initialize the speech handler with OpenAI client and audio settings."""
-        self.client = OpenAI(api_key=get_conf('OPENAI_API_KEY'))
+        # Transcription requests reuse the connection pool of the chat clients
+        self.client = OpenAI(api_key=get_conf('OPENAI_API_KEY'), http_client=HttpHelper.client())
         
         # Audio settings
         self.chunk = 1024
@@ -28,6 +30,13 @@ class SpeechHandler:
         self.channels = 1
         self.rate = 16000
         
+        # End-of-speech detection: stop recording once the user has spoken and
+        # then stayed below the RMS threshold for this long
+        self.silence_threshold = 500
+        self.silence_duration = 0.8
+        # Silence kept around the detected speech when trimming a recording
+        self.speech_padding = 0.2
+        
         # Initialize audio
         # pygame.mixer.init()  # TTS disabled - pygame not needed
         self.p = pyaudio.PyAudio()  # Still needed for STT recording
@@ -74,31 +83,91 @@ class SpeechHandler:
         thread.start()
         return thread
     
+    def _is_silent(self, frame: bytes) -> bool:
+        """Check whether an audio frame is below the speech energy threshold.
+        
+        Args:
+            frame: Raw 16-bit mono audio frame
+            
+        Returns:
+            True if the frame's RMS level is below silence_threshold
+        """
+        samples = array('h', frame)
+        if not samples:
+            return True
+        rms = (sum(sample * sample for sample in samples) / len(samples)) ** 0.5
+        return rms < self.silence_threshold
+    
     def _record_audio(self, duration: float) -> Optional[bytes]:
-        """Record audio from microphone for specified duration.
+        """Record audio from microphone until the speaker pauses.
+        
+        PortAudio delivers each chunk to a callback that copies it into a
+        buffer preallocated for the full duration. Recording stops after
+        silence_duration seconds of silence following speech, so the
+        transcription starts right after the user finishes instead of when
+        the full duration has elapsed. Silence before and after the speech
+        is trimmed (keeping speech_padding seconds), so less audio is sent
+        for transcription.
         
         Args:
-            duration: Recording duration in seconds
+            duration: Maximum recording duration in seconds
             
         Returns:
             Raw audio data as bytes, or None if recording fails
         """
         try:
+            frame_bytes = self.p.get_sample_size(self.format) * self.channels
+            buffer = bytearray(int(self.rate * duration) * frame_bytes)
+            done = threading.Event()
+            max_silent_chunks = int(self.rate / self.chunk * self.silence_duration)
+            position = 0
+            heard_speech = False
+            silent_chunks = 0
+            speech_start = speech_end = 0
+            
+            def _on_audio(in_data, frame_count, time_info, status):
+                nonlocal position, heard_speech, silent_chunks, speech_start, speech_end
+                start = position
+                end = min(position + len(in_data), len(buffer))
+                buffer[position:end] = in_data[:end - position]
+                position = end
+                
+                if not self._is_silent(in_data):
+                    if not heard_speech:
+                        speech_start = start
+                    heard_speech = True
+                    silent_chunks = 0
+                    speech_end = end
+                elif heard_speech:
+                    silent_chunks += 1
+                
+                if position >= len(buffer) or silent_chunks >= max_silent_chunks:
+                    done.set()
+                    return (None, pyaudio.paComplete)
+                return (None, pyaudio.paContinue)
+            
             stream = self.p.open(
                 format=self.format,
                 channels=self.channels,
                 rate=self.rate,
                 input=True,
-                frames_per_buffer=self.chunk
+                frames_per_buffer=self.chunk,
+                stream_callback=_on_audio,
+                start=False
             )
             
-            frames = []
-            for _ in range(int(self.rate / self.chunk * duration)):
-                frames.append(stream.read(self.chunk))
-            
+            stream.start_stream()
+            # Small margin so the last chunk can arrive before the deadline
+            done.wait(duration + 0.5)
             stream.stop_stream()
             stream.close()
-            return b''.join(frames)
+            
+            if not heard_speech:
+                # Nothing above the threshold; let the transcriber judge it
+                return bytes(buffer[:position])
+            
+            padding = int(self.rate * self.speech_padding) * frame_bytes
+            return bytes(buffer[max(0, speech_start - padding):min(position, speech_end + padding)])
             
         except Exception as e:
             LOG.error(f"Recording error: {e}")
@@ -114,23 +183,22 @@ class SpeechHandler:
             Transcribed text, or None if transcription fails
         """
         try:
-            with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as tmp:
-                with wave.open(tmp.name, 'wb') as wf:
-                    wf.setnchannels(self.channels)
-                    wf.setsampwidth(self.p.get_sample_size(self.format))
-                    wf.setframerate(self.rate)
-                    wf.writeframes(audio_data)
-                
-                with open(tmp.name, "rb") as audio_file:
-                    transcript = self.client.audio.transcriptions.create(
-                        model="whisper-1",
-                        file=audio_file,
-                        response_format="text",
-                        language="en"
-                    )
-                
-                os.unlink(tmp.name)
-                return transcript.strip() if transcript else None
+            # Build the WAV in memory and upload it directly, no temp file
+            wav_buffer = io.BytesIO()
+            with wave.open(wav_buffer, 'wb') as wf:
+                wf.setnchannels(self.channels)
+                wf.setsampwidth(self.p.get_sample_size(self.format))
+                wf.setframerate(self.rate)
+                wf.writeframes(audio_data)
+            
+            transcript = self.client.audio.transcriptions.create(
+                model="whisper-1",
+                file=("speech.wav", wav_buffer.getvalue(), "audio/wav"),
+                response_format="text",
+                language="en"
+            )
+            
+            return transcript.strip() if transcript else None
                 
         except Exception as e:
             LOG.error(f"Transcription error: {e}")
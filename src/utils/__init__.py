@@ -1,11 +1,13 @@
 from .utils import (
     get_conf,
+    get_conf_typed,
     get_project_dir,
     load_config,
 )
 
 __all__ = [
     "get_conf",
+    "get_conf_typed",
     "get_project_dir",
     "load_config",
 ]
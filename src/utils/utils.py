@@ -2,7 +2,7 @@
 import io
 import os
 from os import path
-from typing import Any
+from typing import Any, Callable, Dict, Tuple
 
 from dotenv import dotenv_values, load_dotenv
 
@@ -71,10 +71,33 @@ def load_config() -> dict:
 
 config = load_config()
 
+# Converted configuration values, keyed by (key, cast, default_value)
+_TYPED_CONF_CACHE: Dict[Tuple[str, Callable[[Any], Any], Any], Any] = {}
+
 def get_conf(key: str, default_value=None) -> Any:
     """Gets the value for a given key in the configuration file."""
-    try:
-        return config[key]
-    except KeyError:
-        LOG.exception(f"`{key}` env variable not found")
-        return default_value
\ No newline at end of file
+    value = config.get(key)
+    if value is None:
+        if default_value is None:
+            LOG.error(f"`{key}` env variable not found")
+        else:
+            LOG.debug(f"`{key}` env variable not found, using default {default_value!r}")
+        return default_value
+    return value
+
+def get_conf_typed(key: str, default_value=None, cast: Callable[[Any], Any] = str) -> Any:
+    """Gets a configuration value converted with ``cast``, converting it only once.
+
+    Args:
+        key: Configuration key
+        default_value: Value used when the key is not configured
+        cast: Conversion applied to the value, e.g. int or float
+
+    Returns:
+        The converted value, or None if the key is missing and has no default
+    """
+    cache_key = (key, cast, default_value)
+    if cache_key not in _TYPED_CONF_CACHE:
+        value = get_conf(key, default_value)
+        _TYPED_CONF_CACHE[cache_key] = None if value is None else cast(value)
+    return _TYPED_CONF_CACHE[cache_key]